@@ -0,0 +1,196 @@
+import heapq
+import random
+
+from vEB_tree import vEB
+
+# Crossover estimado no README para U=2^24: a vEB só compensa com N > 2^22
+DEFAULT_GROW_THRESHOLD = 2**22
+
+# Operações entre duas reavaliações dos limites pela mistura medida
+DEFAULT_RETUNE_EVERY = 4096
+
+
+class AdaptivePriorityQueue:
+    """
+    Fila de prioridade de inteiros em [0, U-1] que escolhe a estrutura
+    sozinha, com a mesma API de vEB (insert, extract_min, get_min).
+
+    Começa num heap binário (heapq) e migra para uma vEB multiset quando o
+    número de elementos vivos passa de grow_threshold; volta para o heap
+    quando cai abaixo de shrink_threshold. Os dois limites diferentes
+    evitam migrar a cada operação perto do crossover.
+
+    Com uma tabela de custos medida nesta máquina (measure_costs, ou
+    AdaptivePriorityQueue.calibrated), os limites não são fixos: a cada
+    retune_every operações a fila mede a fração de inserções desde a
+    última reavaliação e recalcula o crossover para essa mistura com
+    thresholds_for_mix.
+    """
+
+    def __init__(self, universe_size, grow_threshold=DEFAULT_GROW_THRESHOLD,
+                 shrink_threshold=None, costs=None, retune_every=DEFAULT_RETUNE_EVERY):
+        self.U = universe_size
+        self.grow_threshold = grow_threshold
+        self.shrink_threshold = grow_threshold // 2 if shrink_threshold is None else shrink_threshold
+
+        self._heap = []
+        self._tree = None # vEB multiset, quando ativa
+        self._size = 0
+
+        # Estatísticas da carga (mistura de operações e migrações)
+        self.inserts = 0
+        self.extracts = 0
+        self.migrations = 0
+
+        # Tabela de custos por operação (None: limites fixos) e a janela
+        # de operações usada para medir a mistura
+        self.costs = costs
+        self.retune_every = retune_every
+        self._until_retune = retune_every
+        self._window_inserts = 0
+
+    @classmethod
+    def calibrated(cls, universe_size, retune_every=DEFAULT_RETUNE_EVERY, **kwargs):
+        """
+        Cria a fila com os custos medidos por measure_costs() para este U.
+        Os limites iniciais supõem metade inserções, metade extrações.
+        """
+        costs = measure_costs(universe_size, **kwargs)
+        grow, shrink = thresholds_for_mix(costs, 0.5)
+        return cls(universe_size, grow, shrink, costs=costs, retune_every=retune_every)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def backend(self):
+        return "heapq" if self._tree is None else "vEB"
+
+    @property
+    def insert_ratio(self):
+        """Fração de inserções entre todas as operações até agora."""
+        ops = self.inserts + self.extracts
+        return self.inserts / ops if ops else 0.5
+
+    # --- Operações Principais ---
+
+    def get_min(self):
+
+        if self._tree is not None:
+            return self._tree.get_min()
+        return self._heap[0] if self._heap else None
+
+    def insert(self, x):
+
+        self.inserts += 1
+        self._window_inserts += 1
+        self._size += 1
+        if self.costs is not None:
+            self._tick()
+
+        if self._tree is not None:
+            self._tree.insert(x)
+            return
+
+        heapq.heappush(self._heap, x)
+        if self._size > self.grow_threshold:
+            self._to_veb()
+
+    def extract_min(self):
+
+        if self._size == 0:
+            return None
+
+        self.extracts += 1
+        self._size -= 1
+        if self.costs is not None:
+            self._tick()
+
+        if self._tree is None:
+            return heapq.heappop(self._heap)
+
+        min_to_return = self._tree.extract_min()
+        if self._size < self.shrink_threshold:
+            self._to_heap()
+        return min_to_return
+
+    # --- Mistura de Operações ---
+
+    def _tick(self):
+        # Conta uma operação da janela e, ao fim dela, recalcula os
+        # limites para a mistura observada nessa janela
+        self._until_retune -= 1
+        if self._until_retune:
+            return
+        ratio = self._window_inserts / self.retune_every
+        self._until_retune = self.retune_every
+        self._window_inserts = 0
+        self.grow_threshold, self.shrink_threshold = thresholds_for_mix(self.costs, ratio)
+
+    # --- Migração ---
+
+    def _to_veb(self):
+        # Construção em lote, sem N inserts individuais
+        self._tree = vEB.from_iterable(self._heap, self.U, multiset=True)
+        self._heap = []
+        self.migrations += 1
+
+    def _to_heap(self):
+        # A iteração em ordem crescente já é um heap válido
+        self._heap = list(self._tree)
+        self._tree = None
+        self.migrations += 1
+
+
+def measure_costs(universe_size, sizes=None, n_executions=3, seed=42):
+    """
+    Mede, para cada N, o custo médio por inserção e por extração de
+    mínimo na vEB e no heapq, com as mesmas funções do benchmark: N
+    inserções sozinhas e depois N inserções + N extrações (a diferença é
+    o custo das extrações). Devolve [(N, heap_insert, heap_extract,
+    veb_insert, veb_extract), ...] em segundos por operação.
+    """
+    # Importado aqui para não carregar o benchmark no uso normal da fila
+    from run_benchmark import benchmark_veb, benchmark_heapq
+
+    if sizes is None:
+        sizes = [2**k for k in range(10, 19)]
+
+    rng = random.Random(seed)
+    costs = []
+    for N in sorted(sizes):
+        elements = rng.sample(range(universe_size), N)
+        veb_insert = benchmark_veb(universe_size, elements, n_executions=n_executions,
+                                   n_extractions=0)
+        veb_total = benchmark_veb(universe_size, elements, n_executions=n_executions)
+        heap_insert = benchmark_heapq(elements, n_executions=n_executions, n_extractions=0)
+        heap_total = benchmark_heapq(elements, n_executions=n_executions)
+        costs.append((N,
+                      heap_insert / N, max(heap_total - heap_insert, 0.0) / N,
+                      veb_insert / N, max(veb_total - veb_insert, 0.0) / N))
+    return costs
+
+
+def thresholds_for_mix(costs, insert_ratio):
+    """
+    Devolve (grow_threshold, shrink_threshold) para uma carga com a fração
+    insert_ratio de inserções: o menor N da tabela em que a vEB custa no
+    máximo o mesmo que o heapq por operação. Se a vEB não vencer em nenhum
+    N medido, o limite de crescimento é infinito (nunca migra).
+    """
+    r = insert_ratio
+    for N, heap_insert, heap_extract, veb_insert, veb_extract in costs:
+        heap = r * heap_insert + (1 - r) * heap_extract
+        veb = r * veb_insert + (1 - r) * veb_extract
+        if veb <= heap:
+            return N, N // 2
+
+    return float("inf"), float("inf")
+
+
+def calibrate(universe_size, insert_ratio=0.5, **kwargs):
+    """
+    Mede o crossover vEB x heapq neste universo para a mistura de
+    operações dada e devolve (grow_threshold, shrink_threshold).
+    """
+    return thresholds_for_mix(measure_costs(universe_size, **kwargs), insert_ratio)
@@ -0,0 +1,151 @@
+from vEB_tree import vEB
+
+
+class Timer:
+    """Handle devolvido por schedule; serve para cancel."""
+
+    __slots__ = ("deadline", "callback", "args", "active")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def __repr__(self):
+        return f"Timer(deadline={self.deadline}, active={self.active})"
+
+
+class TimerScheduler:
+    """
+    Agendador de timers com prazos inteiros (ex.: milissegundos) dentro de
+    um horizonte deslizante [now, now + horizon).
+
+    A vEB guarda os ticks que têm algum timer, como chaves t mod U; como o
+    horizonte cabe no universo, cada chave corresponde a um único prazo
+    absoluto e o universo "dá a volta" junto com o relógio. Cada tick tem
+    um balde (dicionário em ordem de inserção) com os seus timers, então
+    vários timers no mesmo tick disparam na ordem em que foram agendados.
+
+    next_deadline é um successor na vEB, O(lg lg U) independente de
+    quantos timers estão pendentes; advance remove os ticks vencidos com
+    delete_range.
+    """
+
+    def __init__(self, horizon, start=0):
+        self.tree = vEB(horizon)
+        self.U = self.tree.U # Potência de 2 >= horizon
+        self.horizon = horizon
+        self.now = start
+        self.buckets = {} # chave (t mod U) -> {Timer: None}
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    # --- Funções Auxiliares ---
+
+    def _to_time(self, key, now):
+        # Prazo absoluto da chave, contado a partir de now
+        return now + (key - now) % self.U
+
+    def _pop_keys(self, keys, now, out):
+        # Esvazia os baldes das chaves removidas da vEB (já em ordem)
+        for key in keys:
+            bucket = self.buckets.pop(key)
+            timers = list(bucket)
+            for timer in timers:
+                timer.active = False
+            self._len -= len(timers)
+            out.append((self._to_time(key, now), timers))
+
+    # --- Operações Principais ---
+
+    def schedule(self, t, callback, *args):
+        """
+        Agenda callback(*args) para o instante t e devolve o Timer.
+        Prazos no passado vencem no próximo advance; t precisa estar antes
+        de now + horizon.
+        """
+        if t >= self.now + self.horizon:
+            raise ValueError("prazo fora do horizonte [now, now + horizon)")
+        t = max(t, self.now)
+        timer = Timer(t, callback, args)
+
+        key = t % self.U
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+            self.tree.insert(key)
+        bucket[timer] = None
+        self._len += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancela o timer; devolve False se ele já disparou ou foi cancelado."""
+        if not timer.active:
+            return False
+        timer.active = False
+
+        key = timer.deadline % self.U
+        bucket = self.buckets[key]
+        del bucket[timer]
+        if not bucket:
+            del self.buckets[key]
+            self.tree.delete(key)
+        self._len -= 1
+        return True
+
+    def next_deadline(self):
+        """Menor prazo pendente (>= now), ou None."""
+        tree = self.tree
+        if tree.min_val is None:
+            return None
+
+        # Primeira chave a partir de now mod U; se não houver, dá a volta
+        now_key = self.now % self.U
+        key = tree.successor(now_key - 1) if now_key > 0 else tree.get_min()
+        if key is None:
+            key = tree.get_min()
+        return self._to_time(key, self.now)
+
+    def advance(self, now):
+        """
+        Avança o relógio até now e devolve os timers vencidos (prazo <= now)
+        em lotes [(prazo, [timers...]), ...], em ordem de prazo. Os
+        callbacks não são chamados; ver run_due.
+        """
+        if now < self.now:
+            raise ValueError("o relógio não pode voltar")
+        old = self.now
+        self.now = now
+        expired = []
+        if self.tree.min_val is None:
+            return expired
+
+        U = self.U
+        if now - old >= U:
+            # A janela inteira venceu
+            lo_key = old % U
+            keys = self.tree.delete_range(lo_key, U) + self.tree.delete_range(0, lo_key)
+            self._pop_keys(keys, old, expired)
+            return expired
+
+        lo_key = old % U
+        hi_key = now % U
+        if lo_key <= hi_key:
+            keys = self.tree.delete_range(lo_key, hi_key + 1)
+        else:
+            # O intervalo [old, now] dá a volta no universo
+            keys = self.tree.delete_range(lo_key, U) + self.tree.delete_range(0, hi_key + 1)
+        self._pop_keys(keys, old, expired)
+        return expired
+
+    def run_due(self, now):
+        """Avança até now, chama os callbacks vencidos e devolve quantos foram."""
+        fired = 0
+        for _, timers in self.advance(now):
+            for timer in timers:
+                timer.callback(*timer.args)
+                fired += 1
+        return fired
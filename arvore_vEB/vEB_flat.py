@@ -0,0 +1,168 @@
+from array import array
+
+# Cada palavra de máquina guarda 64 chaves (um bit por chave)
+WORD_BITS = 64
+WORD_SHIFT = 6
+WORD_MASK = WORD_BITS - 1
+
+
+class vEBFlat:
+    """
+    Variante "achatada" da árvore vEB, com a mesma API pública de vEB.
+
+    Em vez de um objeto vEB por cluster, cada nível da estrutura é um único
+    array de inteiros de 64 bits pré-alocado. A recursão para quando o
+    cluster cabe em uma palavra de máquina: o nível 0 guarda um bit por
+    chave, e cada nível acima guarda um bit por palavra não vazia do nível
+    de baixo (o "summary"). Para U = 2^24 são apenas 4 níveis, e as
+    operações dentro de uma palavra viram truques de bits (bit_length e
+    isolamento do bit menos significativo).
+    """
+
+    def __init__(self, universe_size):
+        # Arredonda U para a próxima potência de 2 (mesma regra de vEB)
+        if universe_size <= 2:
+            self.U = 2
+        else:
+            self.U = 1 << (universe_size - 1).bit_length()
+
+        self.min_val = None
+        self.max_val = None
+
+        # Pré-aloca todos os níveis, das folhas até uma única palavra
+        self.levels = []
+        n = self.U
+        while True:
+            words = (n + WORD_MASK) >> WORD_SHIFT
+            self.levels.append(array('Q', [0]) * words)
+            if words == 1:
+                break
+            n = words
+
+    # --- Funções Auxiliares ---
+    def _next(self, x):
+        # Menor chave > x, percorrendo apenas os níveis (ignora min/max)
+        levels = self.levels
+        depth = len(levels)
+        lvl = 0
+        while lvl < depth:
+            level = levels[lvl]
+            w = level[x >> WORD_SHIFT] >> ((x & WORD_MASK) + 1)
+            if w:
+                # Bit mais baixo acima de x nesta palavra
+                x += (w & -w).bit_length()
+                # Desce sempre pelo menor bit de cada palavra
+                while lvl > 0:
+                    lvl -= 1
+                    w = levels[lvl][x]
+                    x = (x << WORD_SHIFT) + (w & -w).bit_length() - 1
+                return x
+            x >>= WORD_SHIFT
+            lvl += 1
+        return None
+
+    def _prev(self, x):
+        # Maior chave < x, percorrendo apenas os níveis (ignora min/max)
+        levels = self.levels
+        depth = len(levels)
+        lvl = 0
+        while lvl < depth:
+            level = levels[lvl]
+            i = x >> WORD_SHIFT
+            w = level[i] & ((1 << (x & WORD_MASK)) - 1)
+            if w:
+                # Bit mais alto abaixo de x nesta palavra
+                x = (i << WORD_SHIFT) + w.bit_length() - 1
+                # Desce sempre pelo maior bit de cada palavra
+                while lvl > 0:
+                    lvl -= 1
+                    w = levels[lvl][x]
+                    x = (x << WORD_SHIFT) + w.bit_length() - 1
+                return x
+            x = i
+            lvl += 1
+        return None
+
+    # --- Operações Principais ---
+
+    def get_min(self):
+
+        return self.min_val
+
+    def get_max(self):
+
+        return self.max_val
+
+    def member(self, x):
+
+        if x < 0 or x >= self.U:
+            return False
+        return (self.levels[0][x >> WORD_SHIFT] >> (x & WORD_MASK)) & 1 == 1
+
+    def insert(self, x):
+
+        # Atualiza min/max em O(1)
+        if self.min_val is None:
+            self.min_val = self.max_val = x
+        elif x < self.min_val:
+            self.min_val = x
+        elif x > self.max_val:
+            self.max_val = x
+
+        # Marca o bit em cada nível; para assim que a palavra já tinha
+        # algum bit (os níveis acima já estão marcados)
+        for level in self.levels:
+            i = x >> WORD_SHIFT
+            w = level[i]
+            level[i] = w | (1 << (x & WORD_MASK))
+            if w:
+                return
+            x = i
+
+    def successor(self, x):
+
+        if self.max_val is None or x >= self.max_val:
+            return None
+        if x < self.min_val:
+            return self.min_val
+        return self._next(x)
+
+    def predecessor(self, x):
+
+        if self.min_val is None or x <= self.min_val:
+            return None
+        if x > self.max_val:
+            return self.max_val
+        return self._prev(x)
+
+    def delete(self, x):
+
+        if not self.member(x):
+            return
+
+        # Limpa o bit em cada nível; para assim que a palavra continua
+        # não vazia (os níveis acima continuam corretos)
+        y = x
+        for level in self.levels:
+            i = y >> WORD_SHIFT
+            w = level[i] & ~(1 << (y & WORD_MASK))
+            level[i] = w
+            if w:
+                break
+            y = i
+
+        # Atualiza min/max
+        if x == self.min_val:
+            if x == self.max_val:
+                self.min_val = self.max_val = None
+            else:
+                self.min_val = self._next(x)
+        elif x == self.max_val:
+            self.max_val = self._prev(x)
+
+    def extract_min(self):
+
+        min_to_return = self.min_val
+        if min_to_return is not None:
+            self.delete(min_to_return)
+        return min_to_return
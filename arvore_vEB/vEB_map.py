@@ -0,0 +1,414 @@
+from vEB_tree import vEB
+
+# Marca "chave ausente" em get, já que None é um valor válido
+_MISSING = object()
+
+
+class vEBMap(vEB):
+    """
+    Mapa ordenado de chaves inteiras em [0, U-1] para valores arbitrários.
+
+    Cada nó guarda o valor ao lado do seu min (min_data) e do seu max
+    (max_data), então o valor acompanha a chave nas trocas com o mínimo e
+    as consultas de predecessor/sucessor (floor_item, ceiling_item)
+    devolvem chave e valor numa única descida. Os summaries continuam
+    sendo vEB simples, pois só guardam índices de clusters.
+    """
+
+    def __init__(self, universe_size):
+        super().__init__(universe_size)
+        self.min_data = None
+        self.max_data = None
+        self._len = 0
+
+    @classmethod
+    def from_sorted(cls, keys, universe_size, multiset=False):
+        # A montagem em lote de vEB não leva valores; as chaves entram
+        # uma a uma, mapeadas para None
+        if multiset:
+            raise ValueError("vEBMap não tem modo multiset")
+        tree = cls(universe_size)
+        for k in keys:
+            tree.insert(k)
+        return tree
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, key):
+        return self.member(key)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        if self._remove(key) is _MISSING:
+            raise KeyError(key)
+
+    # --- Consultas ---
+
+    def get(self, key, default=None):
+
+        node = self
+        x = key
+        while True:
+            # O max de cada nó também carrega o seu valor
+            if x == node.min_val:
+                return node.min_data
+            if x == node.max_val:
+                return node.max_data
+            if node.U == 2:
+                return default
+
+            l_sqrt_U = node.l_sqrt_U
+            node = node.clusters.get(x // l_sqrt_U)
+            if node is None:
+                return default
+            x %= l_sqrt_U
+
+    def floor_item(self, x):
+        """Devolve (chave, valor) da maior chave <= x, ou None."""
+        if self.max_val is not None and x >= self.max_val:
+            return self.max_val, self.max_data
+        return self._pred_item(x + 1)
+
+    def ceiling_item(self, x):
+        """Devolve (chave, valor) da menor chave >= x, ou None."""
+        if self.min_val is not None and x <= self.min_val:
+            return self.min_val, self.min_data
+        return self._succ_item(x - 1)
+
+    def _succ_item(self, x):
+        # Como vEB.successor, mas levando o valor junto. A descida só entra
+        # num cluster quando a resposta está garantida nele, então basta
+        # acumular o deslocamento; a busca no summary é uma vEB simples.
+        node = self
+        base = 0
+        while True:
+            if node.U == 2:
+                if x == 0 and node.max_val == 1:
+                    return base + 1, node.max_data
+                return None
+
+            if node.min_val is not None and x < node.min_val:
+                return base + node.min_val, node.min_data
+
+            l_sqrt_U = node.l_sqrt_U
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+
+            cluster = node.clusters.get(h)
+            if cluster is not None and l < cluster.max_val:
+                base += h * l_sqrt_U
+                node = cluster
+                x = l
+                continue
+
+            h = node.summary.successor(h)
+            if h is None:
+                return None
+            cluster = node.clusters[h]
+            return base + h * l_sqrt_U + cluster.min_val, cluster.min_data
+
+    def _pred_item(self, x):
+        # Como vEB.predecessor, mas levando o valor junto
+        node = self
+        base = 0
+        while True:
+            if node.U == 2:
+                if x == 1 and node.min_val == 0:
+                    return base, node.min_data
+                return None
+
+            if node.max_val is not None and x > node.max_val:
+                return base + node.max_val, node.max_data
+
+            l_sqrt_U = node.l_sqrt_U
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+
+            cluster = node.clusters.get(h)
+            if cluster is not None and l > cluster.min_val:
+                base += h * l_sqrt_U
+                node = cluster
+                x = l
+                continue
+
+            h = node.summary.predecessor(h)
+            if h is None:
+                # Se não há cluster anterior, pode ser o min_val
+                if node.min_val is not None and x > node.min_val:
+                    return base + node.min_val, node.min_data
+                return None
+            cluster = node.clusters[h]
+            return base + h * l_sqrt_U + cluster.max_val, cluster.max_data
+
+    # --- Iteração Ordenada ---
+
+    def items(self):
+        """Percorre os pares (chave, valor) em ordem crescente de chave."""
+        return self._items_asc(0)
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for _, value in self._items_asc(0):
+            yield value
+
+    def _items_asc(self, base):
+        # Mesma pilha explícita de vEB._iter_asc, no universo inteiro:
+        # cada par é gerado uma vez, no nó em que está a chave
+        if self.min_val is None:
+            return
+        yield base + self.min_val, self.min_data
+        if self.U == 2:
+            if self.max_val != self.min_val:
+                yield base + self.max_val, self.max_data
+            return
+
+        stack = []
+        level = (iter(self.summary), self.clusters, base, self.l_sqrt_U)
+        while True:
+            highs, clusters, base, l_sqrt_U = level
+            for h in highs:
+                node = clusters[h]
+                node_base = base + h * l_sqrt_U
+                yield node_base + node.min_val, node.min_data
+                if node.min_val == node.max_val:
+                    continue
+                if node.U == 2:
+                    yield node_base + node.max_val, node.max_data
+                    continue
+
+                # Desce para o cluster; este nível continua depois dele
+                stack.append(level)
+                level = (iter(node.summary), node.clusters, node_base, node.l_sqrt_U)
+                break
+            else:
+                if not stack:
+                    return
+                level = stack.pop()
+
+    # --- Atualizações ---
+
+    def insert(self, x, value=None):
+
+        node = self
+        while True:
+            # Caso 1: Nó vazio
+            if node.min_val is None:
+                node.min_val = node.max_val = x
+                node.min_data = node.max_data = value
+                self._len += 1
+                return
+
+            # Chave já presente: só troca o valor onde ele aparece
+            if x == node.min_val:
+                node.min_data = value
+                if x == node.max_val:
+                    node.max_data = value
+                return
+            if x == node.max_val:
+                node.max_data = value
+                if node.U == 2:
+                    return
+
+            # Caso 2: Troca com o mínimo (chave e valor), se necessário
+            if x < node.min_val:
+                x, node.min_val = node.min_val, x
+                value, node.min_data = node.min_data, value
+
+            # Atualiza o máximo
+            if x > node.max_val:
+                node.max_val = x
+                node.max_data = value
+
+            if node.U == 2:
+                self._len += 1
+                return
+
+            l_sqrt_U = node.l_sqrt_U
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+            cluster = node.clusters.get(h)
+
+            # Caso 3: Cluster vazio recebe (l, valor) em O(1) e 'h' vai
+            # para o summary
+            if cluster is None:
+                cluster = vEBMap(l_sqrt_U)
+                cluster.min_val = cluster.max_val = l
+                cluster.min_data = cluster.max_data = value
+                node.clusters[h] = cluster
+                node.summary.insert(h)
+                self._len += 1
+                return
+
+            node = cluster
+            x = l
+
+    def pop(self, key, *default):
+        """Remove a chave e devolve o seu valor (ou default, se ausente)."""
+        value = self._remove(key)
+        if value is _MISSING:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return value
+
+    def delete(self, x):
+
+        self._remove(x)
+
+    def _remove(self, x):
+        # Remove x e devolve o seu valor (ou _MISSING), numa única descida.
+        # Depois que um min é substituído (Caso 3), a descida continua só
+        # para tirar o novo min do cluster; o valor removido já é conhecido.
+        removed = _MISSING
+        path = []
+        node = self
+        while True:
+            h = None
+
+            # Caso 1: Único elemento
+            if node.min_val == node.max_val:
+                if x == node.min_val:
+                    if removed is _MISSING:
+                        removed = node.min_data
+                    node.min_val = node.max_val = None
+                    node.min_data = node.max_data = None
+
+            # Caso 2: Base U=2
+            elif node.U == 2:
+                if removed is _MISSING:
+                    removed = node.min_data if x == 0 else node.max_data
+                if x == 0:
+                    node.min_val = 1
+                    node.min_data = node.max_data
+                node.max_val = node.min_val
+                node.max_data = node.min_data
+
+            # Caso 3: Removendo o mínimo
+            elif x == node.min_val:
+                if removed is _MISSING:
+                    removed = node.min_data
+                first_cluster_idx = node.summary.min_val
+                if first_cluster_idx is None:
+                    node.min_val = node.max_val
+                    node.min_data = node.max_data
+                else:
+                    h = first_cluster_idx
+                    cluster = node.clusters[h]
+                    l = cluster.min_val
+                    x = node.min_val = h * node.l_sqrt_U + l
+                    node.min_data = cluster.min_data
+
+            # Caso 4: Remoção normal
+            else:
+                h = x // node.l_sqrt_U
+                if h in node.clusters:
+                    l = x % node.l_sqrt_U
+                else:
+                    h = None # Item não existe
+
+            if h is None:
+                break
+            path.append((node, h, x))
+            node = node.clusters[h]
+            x = l
+
+        # Subida: remove clusters vazios e corrige max/max_data
+        while path:
+            node, h, x = path.pop()
+            if node.clusters[h].min_val is None:
+                del node.clusters[h]
+                node.summary.delete(h)
+
+            if x == node.max_val:
+                last_cluster_idx = node.summary.max_val
+                if last_cluster_idx is None:
+                    node.max_val = node.min_val
+                    node.max_data = node.min_data
+                else:
+                    cluster = node.clusters[last_cluster_idx]
+                    node.max_val = last_cluster_idx * node.l_sqrt_U + cluster.max_val
+                    node.max_data = cluster.max_data
+
+        if removed is not _MISSING:
+            self._len -= 1
+        return removed
+
+    def extract_min(self):
+
+        item = self.pop_min_item()
+        return None if item is None else item[0]
+
+    def pop_min_item(self):
+        """Remove a menor chave e devolve (chave, valor), ou None."""
+        if self.min_val is None:
+            return None
+
+        item = (self.min_val, self.min_data)
+        path = []
+        node = self
+        while True:
+            # 1. Se min == max, o nó fica vazio
+            if node.min_val == node.max_val:
+                node.min_val = node.max_val = None
+                node.min_data = node.max_data = None
+
+            # 2. Caso Base U=2
+            elif node.U == 2:
+                node.min_val = node.max_val
+                node.min_data = node.max_data
+
+            else:
+                first_cluster_idx = node.summary.min_val
+                if first_cluster_idx is None:
+                    node.min_val = node.max_val
+                    node.min_data = node.max_data
+                else:
+                    # O novo min (e o seu valor) vem do primeiro cluster
+                    cluster = node.clusters[first_cluster_idx]
+                    node.min_val = first_cluster_idx * node.l_sqrt_U + cluster.min_val
+                    node.min_data = cluster.min_data
+                    path.append((node, first_cluster_idx))
+                    node = cluster
+                    continue
+            break
+
+        # Limpeza: clusters que ficaram vazios saem do summary
+        while path:
+            node, first_cluster_idx = path.pop()
+            if node.clusters[first_cluster_idx].min_val is None:
+                del node.clusters[first_cluster_idx]
+                node.summary.extract_min()
+
+        self._len -= 1
+        return item
+
+    # --- Remoção em Lote ---
+    # As versões de vEB refazem min/max dos nós sem mover min_data/max_data
+    # nem atualizar _len, então aqui cada chave sai com o seu valor.
+
+    def extract_min_k(self, k):
+        """Remove as k menores chaves e devolve-as em ordem crescente."""
+        return [self.pop_min_item()[0] for _ in range(min(k, self._len))]
+
+    def delete_range(self, lo, hi):
+        """Remove todas as chaves do intervalo [lo, hi) e devolve-as em ordem."""
+        removed = list(self.iter_range(lo, hi))
+        for key in removed:
+            self._remove(key)
+        return removed
+
+    def delete_many(self, keys):
+        """Remove várias chaves de uma vez e devolve as removidas em ordem."""
+        keys = sorted(set(k for k in keys if 0 <= k < self.U))
+        return [key for key in keys if self._remove(key) is not _MISSING]
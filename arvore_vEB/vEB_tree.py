@@ -1,8 +1,47 @@
 
 import math
+import mmap
+from array import array
+from bisect import bisect_left
+from itertools import islice
+
+# Cabeçalho do arquivo de snapshot: MAGIC, VERSION, U, posição da raiz.
+# MAGIC é b"vEBSNAP1" lido como int64 nativo, então um arquivo gravado em
+# outra ordem de bytes é rejeitado na abertura.
+SNAPSHOT_MAGIC = int.from_bytes(b"vEBSNAP1", "little")
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = 4
+
+_new_node = object.__new__
+
+# (l_sqrt_U, u_sqrt_U) de cada universo potência de 2 já visto, para
+# montar nós sem passar por __init__
+_SPLITS = {}
+
+def _split(U):
+    split = _SPLITS.get(U)
+    if split is None:
+        p = U.bit_length() - 1
+        split = _SPLITS[U] = (1 << (p // 2), 1 << (p - p // 2))
+    return split
+
+# Summaries vazios compartilhados pelos nós de uma chave só montados em
+# lote, um por universo. Nunca são alterados: só insert poderia, e ele
+# substitui um summary vazio por um nó novo antes de inserir
+_EMPTY_SUMMARIES = {}
+
+def _empty_summary(U):
+    summary = _EMPTY_SUMMARIES.get(U)
+    if summary is None:
+        summary = _EMPTY_SUMMARIES[U] = vEB(U)
+    return summary
 
 class vEB:
-    def __init__(self, universe_size):
+    # Contagem por chave no modo multiset (None no modo conjunto). Só a
+    # raiz usa: os clusters e summaries são sempre conjuntos.
+    _counts = None
+
+    def __init__(self, universe_size, multiset=False):
         # Arredonda U para a próxima potência de 2 
         if universe_size <= 2:
             self.U = 2
@@ -26,6 +65,11 @@ class vEB:
             self.summary = vEB(self.u_sqrt_U)
             self.clusters = {} # Dicionário para clusters esparsos
 
+        # Modo multiset: chaves repetidas só incrementam a contagem, sem
+        # aumentar o universo com desempates codificados na chave
+        if multiset:
+            self._counts = {}
+
     # --- Funções Auxiliares ---
     def high(self, x):
         
@@ -36,9 +80,112 @@ class vEB:
         return x % self.l_sqrt_U
 
     def index(self, h, l):
-        
+
         return h * self.l_sqrt_U + l
 
+    # --- Construção em Lote ---
+
+    @classmethod
+    def from_iterable(cls, keys, universe_size, multiset=False):
+        """
+        Constrói uma vEB a partir de chaves em qualquer ordem.
+        Ordena (e remove duplicatas) uma única vez e delega a from_sorted.
+        """
+        keys = sorted(keys) if multiset else sorted(set(keys))
+        return cls.from_sorted(keys, universe_size, multiset=multiset)
+
+    @classmethod
+    def from_sorted(cls, keys, universe_size, multiset=False):
+        """
+        Constrói uma vEB a partir de chaves em ordem crescente.
+        Os clusters e summaries são montados de baixo para cima, sem a
+        troca com o mínimo feita a cada insert. No modo multiset, as
+        repetições viram contagens.
+        """
+        tree = cls(universe_size, multiset=multiset)
+        counts = tree._counts
+        unique = []
+        for k in keys:
+            if not unique or k != unique[-1]:
+                unique.append(k)
+                if counts is not None:
+                    counts[k] = 1
+            elif counts is not None:
+                counts[k] += 1
+        if unique and (unique[0] < 0 or unique[-1] >= tree.U):
+            raise ValueError("chave fora do universo [0, U-1]")
+        if unique:
+            tree.min_val = unique[0]
+            tree.max_val = unique[-1]
+            if tree.U > 2 and len(unique) > 1:
+                tree._fill_clusters(unique)
+        return tree
+
+    @staticmethod
+    def _build_sorted(U, keys):
+        # Monta um nó de universo U (potência de 2) com chaves estritamente
+        # crescentes, sem passar por __init__: o summary é montado direto
+        # dos índices dos clusters, e não criado vazio e depois preenchido
+        node = _new_node(vEB)
+        node.U = U
+        node.min_val = keys[0]
+        node.max_val = keys[-1]
+        if U > 2:
+            node.l_sqrt_U, node.u_sqrt_U = _split(U)
+            if len(keys) > 1:
+                node._fill_clusters(keys)
+            else:
+                # Nó com uma chave só: sem clusters, e o summary vazio é
+                # compartilhado (insert troca-o antes de inserir nele)
+                node.clusters = {}
+                node.summary = _empty_summary(node.u_sqrt_U)
+        return node
+
+    def _fill_clusters(self, keys):
+        # O min fica só neste nível; o max também desce para os clusters.
+        # Agrupa as chaves restantes por cluster (são contíguas, pois
+        # estão ordenadas) e monta cada cluster recursivamente
+        l_sqrt_U = self.l_sqrt_U
+        build = vEB._build_sorted
+        new_node = _new_node
+
+        # Os clusters de uma chave só (a maioria, com chaves esparsas)
+        # são montados aqui mesmo, sem a chamada recursiva
+        leaf = l_sqrt_U == 2
+        if not leaf:
+            c_split = _split(l_sqrt_U)
+            c_summary = _empty_summary(c_split[1])
+
+        clusters = {}
+        highs = []
+        i = 1
+        n = len(keys)
+        while i < n:
+            k = keys[i]
+            h = k // l_sqrt_U
+            base = h * l_sqrt_U
+            end = base + l_sqrt_U
+            j = i + 1
+            while j < n and keys[j] < end:
+                j += 1
+            if j == i + 1:
+                cluster = new_node(vEB)
+                cluster.U = l_sqrt_U
+                cluster.min_val = cluster.max_val = k - base
+                if not leaf:
+                    cluster.l_sqrt_U, cluster.u_sqrt_U = c_split
+                    cluster.clusters = {}
+                    cluster.summary = c_summary
+            else:
+                cluster = build(l_sqrt_U, [x - base for x in keys[i:j]])
+            clusters[h] = cluster
+            highs.append(h)
+            i = j
+
+        # O summary recebe os índices dos clusters, também já ordenados
+        self.clusters = clusters
+        self.summary = build(self.u_sqrt_U, highs)
+
     # --- Operações Principais ---
     
     def get_min(self):
@@ -50,225 +197,915 @@ class vEB:
         return self.max_val
 
     def member(self, x):
-        
-        # Passo 1: Verifica min e max 
-        if x == self.min_val or x == self.max_val:
-            return True
-        
-        # Passo 2: Caso base 
-        if self.U == 2:
-            return False
 
-        # Passo 3: Recurso no cluster 
-        h = self.high(x)
-        l = self.low(x)
+        node = self
+        while True:
+            # Passo 1: Verifica min e max
+            if x == node.min_val or x == node.max_val:
+                return True
 
-        if h not in self.clusters:
-            return False
-        else:
-            return self.clusters[h].member(l)
+            # Passo 2: Caso base
+            if node.U == 2:
+                return False
+
+            # Passo 3: Desce para o cluster
+            l_sqrt_U = node.l_sqrt_U
+            node = node.clusters.get(x // l_sqrt_U)
+            if node is None:
+                return False
+            x %= l_sqrt_U
+
+    def count(self, x):
+        """Número de cópias de x (0 ou 1 fora do modo multiset)."""
+        if self._counts is not None:
+            return self._counts.get(x, 0)
+        return 1 if self.member(x) else 0
 
     def insert(self, x):
-        
-        # Caso 1: Árvore está vazia 
-        if self.min_val is None:
-            self.min_val = self.max_val = x
-            return
 
-        # Caso 2: Troca com o mínimo, se necessário 
-        if x < self.min_val:
-            x, self.min_val = self.min_val, x
+        # Modo multiset: uma chave repetida só incrementa a contagem
+        counts = self._counts
+        if counts is not None:
+            c = counts.get(x, 0)
+            counts[x] = c + 1
+            if c:
+                return
 
-        # A recursão só continua se U > 2
-        if self.U > 2:
-            h = self.high(x)
-            l = self.low(x)
+        node = self
+        while True:
+            # Caso 1: Nó vazio
+            if node.min_val is None:
+                node.min_val = node.max_val = x
+                return
+
+            # Caso 2: Troca com o mínimo, se necessário
+            if x < node.min_val:
+                x, node.min_val = node.min_val, x
+
+            # Atualiza o máximo
+            if x > node.max_val:
+                node.max_val = x
+
+            # A descida só continua se U > 2
+            if node.U == 2:
+                return
+
+            l_sqrt_U = node.l_sqrt_U
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+            cluster = node.clusters.get(h)
 
             # Caso 3: Inserção no cluster
-            # Se o cluster 'h' está vazio
-            if h not in self.clusters:
-                # Insere 'h' no summary 
-                self.summary.insert(h)
-                # Cria o novo cluster
-                self.clusters[h] = vEB(self.l_sqrt_U)
-                # Insere 'l' (min e max) no novo cluster
-                self.clusters[h].insert(l)
+            if cluster is None:
+                # O cluster novo já nasce com 'l' (como min e max) e a
+                # descida continua pelo summary, inserindo 'h'
+                node.clusters[h] = vEB._build_sorted(l_sqrt_U, (l,))
+                if node.summary.min_val is None:
+                    # Summary vazio (talvez compartilhado): é trocado por
+                    # um nó novo já com 'h'
+                    node.summary = vEB._build_sorted(node.u_sqrt_U, (h,))
+                    return
+                node = node.summary
+                x = h
             else:
-                # Se o cluster já existe 
-                self.clusters[h].insert(l)
-
-        # Atualiza o máximo 
-        if x > self.max_val:
-            self.max_val = x
+                # Se o cluster já existe, a descida continua por ele
+                node = cluster
+                x = l
 
     def successor(self, x):
-        
-        # 1. Caso base U=2
-        if self.U == 2:
-            if x == 0 and self.max_val == 1: return 1
-            else: return None
 
-        # 2. Caso 1: Se x < min, sucessor é o min 
-        if self.min_val is not None and x < self.min_val:
-            return self.min_val
+        # Pilha com os níveis visitados: (nó, h) quando a descida foi
+        # pelo cluster 'h', ou (nó, None) quando foi pelo summary
+        path = []
+        node = self
+        while True:
+            # 1. Caso base U=2
+            if node.U == 2:
+                result = 1 if x == 0 and node.max_val == 1 else None
+                break
 
-        h = self.high(x)
-        l = self.low(x)
+            # 2. Caso 1: Se x < min, sucessor é o min
+            if node.min_val is not None and x < node.min_val:
+                result = node.min_val
+                break
 
-        # 3. Caso 2: Tentar encontrar sucessor DENTRO do cluster de x 
-        max_in_cluster_obj = self.clusters.get(h, None)
-        
-        if max_in_cluster_obj is not None:
-             max_in_cluster_val = max_in_cluster_obj.get_max()
-             if max_in_cluster_val is not None and l < max_in_cluster_val:
-                succ_low = max_in_cluster_obj.successor(l)
-                if succ_low is not None:
-                    return self.index(h, succ_low)
-        
-        # 4. Caso 3: Se não, procure o PRÓXIMO cluster 
-        succ_cluster_idx = self.summary.successor(h)
-        if succ_cluster_idx is None:
-            return None # Sem sucessor
+            l_sqrt_U = node.l_sqrt_U
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+
+            # 3. Caso 2: O sucessor está DENTRO do cluster de x
+            cluster = node.clusters.get(h)
+            if cluster is not None and cluster.max_val is not None and l < cluster.max_val:
+                path.append((node, h))
+                node = cluster
+                x = l
+            else:
+                # 4. Caso 3: Procura o PRÓXIMO cluster no summary
+                path.append((node, None))
+                node = node.summary
+                x = h
 
-        # 5. O sucessor é o MENOR elemento do próximo cluster
-        succ_low = self.clusters[succ_cluster_idx].get_min()
-        return self.index(succ_cluster_idx, succ_low)
+        # Sobe a pilha convertendo o resultado para cada nível
+        while path:
+            node, h = path.pop()
+            if h is not None:
+                result = h * node.l_sqrt_U + result
+            elif result is not None:
+                # 5. O sucessor é o MENOR elemento do próximo cluster
+                result = result * node.l_sqrt_U + node.clusters[result].min_val
+        return result
 
     def predecessor(self, x):
-       
-        # 1. Caso base U=2
-        if self.U == 2:
-            if x == 1 and self.min_val == 0: return 0
-            else: return None
-        
-        # 2. Caso 1: Se x > max, predecessor é o max 
-        if self.max_val is not None and x > self.max_val:
-            return self.max_val
 
-        h = self.high(x)
-        l = self.low(x)
+        # Pilha com os níveis visitados: (nó, h, x) quando a descida foi
+        # pelo cluster 'h', ou (nó, None, x) quando foi pelo summary
+        path = []
+        node = self
+        while True:
+            # 1. Caso base U=2
+            if node.U == 2:
+                result = 0 if x == 1 and node.min_val == 0 else None
+                break
 
-        # 3. Caso 2: Tentar encontrar predecessor DENTRO do cluster 
-        min_in_cluster_obj = self.clusters.get(h, None)
-        
-        if min_in_cluster_obj is not None:
-            min_in_cluster_val = min_in_cluster_obj.get_min()
-            if min_in_cluster_val is not None and l > min_in_cluster_val:
-                pred_low = min_in_cluster_obj.predecessor(l)
-                if pred_low is not None:
-                    return self.index(h, pred_low)
-        
-        # 4. Caso 3: Se não, procure o cluster ANTERIOR 
-        pred_cluster_idx = self.summary.predecessor(h)
+            # 2. Caso 1: Se x > max, predecessor é o max
+            if node.max_val is not None and x > node.max_val:
+                result = node.max_val
+                break
+
+            l_sqrt_U = node.l_sqrt_U
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
 
-        if pred_cluster_idx is None:
-            # 5. Se não há cluster anterior, pode ser o min_val 
-            if self.min_val is not None and x > self.min_val:
-                return self.min_val
+            # 3. Caso 2: O predecessor está DENTRO do cluster de x
+            cluster = node.clusters.get(h)
+            if cluster is not None and cluster.min_val is not None and l > cluster.min_val:
+                path.append((node, h, x))
+                node = cluster
+                x = l
             else:
-                return None
-        else:
-            # 6. O predecessor é o MAIOR elemento do cluster anterior
-            pred_low = self.clusters[pred_cluster_idx].get_max()
-            return self.index(pred_cluster_idx, pred_low)
+                # 4. Caso 3: Procura o cluster ANTERIOR no summary
+                path.append((node, None, x))
+                node = node.summary
+                x = h
 
-    def delete(self, x):
-        
-        # Caso 1: Único elemento
-        if self.min_val == self.max_val:
-            if x == self.min_val:
-                self.min_val = self.max_val = None
-            return
+        # Sobe a pilha convertendo o resultado para cada nível
+        while path:
+            node, h, x = path.pop()
+            if h is not None:
+                result = h * node.l_sqrt_U + result
+            elif result is not None:
+                # 6. O predecessor é o MAIOR elemento do cluster anterior
+                result = result * node.l_sqrt_U + node.clusters[result].max_val
+            elif node.min_val is not None and x > node.min_val:
+                # 5. Se não há cluster anterior, pode ser o min_val
+                result = node.min_val
+        return result
 
-        # Caso 2: Base U=2 
-        if self.U == 2:
-            if x == 0:
-                self.min_val = 1
-            else: # x == 1
-                self.min_val = 0 # max_val é implicitamente 0
-            self.max_val = self.min_val
-            return
+    def delete(self, x):
 
-        # Caso 3: Removendo o mínimo 
-        if x == self.min_val:
-            first_cluster_idx = self.summary.get_min()
-            
-            # Se não há clusters, o único outro elemento é o max_val
-            if first_cluster_idx is None:
-                self.min_val = self.max_val
+        # Modo multiset: só remove a chave da árvore na última cópia
+        counts = self._counts
+        if counts is not None:
+            c = counts.get(x)
+            if c is None:
                 return
-            
-            # Encontra o próximo menor (o min do primeiro cluster)
-            l = self.clusters[first_cluster_idx].get_min()
-            self.min_val = self.index(first_cluster_idx, l)
-            
-            # Prepara para deletar 'l' do cluster 'first_cluster_idx'
-            h = first_cluster_idx
-            x_to_delete_recursively = l
-            # O 'x' original (que era o min) agora é tratado como o novo min,
-            # para que a lógica de atualização do max no final funcione.
-            x = self.min_val 
-            
-        else: # Caso 4: Remoção normal 
-            h = self.high(x)
-            x_to_delete_recursively = self.low(x)
-            if h not in self.clusters:
-                return # Item não existe (ou é o max, tratado abaixo)
-
-        # --- Passo Recursivo (para Casos 3 e 4) ---
-        if h in self.clusters: # (Necessário para Caso 4)
-            self.clusters[h].delete(x_to_delete_recursively)
-
-            # Caso 5: Cluster ficou vazio 
-            if self.clusters[h].get_min() is None:
-                self.summary.delete(h)
-                del self.clusters[h]
-        
-        # --- Atualização do Max (se necessário) ---
-        if x == self.max_val:
-            last_cluster_idx = self.summary.get_max()
-            
-            # Se não há mais clusters, o único elemento é o min_val
-            if last_cluster_idx is None:
-                self.max_val = self.min_val
+            if c > 1:
+                counts[x] = c - 1
+                return
+            del counts[x]
+
+        # Pilha de níveis que ainda precisam de limpeza após a descida:
+        # (nó, h, x, summary_feito)
+        path = []
+        node = self
+        while True:
+            h = None
+
+            # Caso 1: Único elemento
+            if node.min_val == node.max_val:
+                if x == node.min_val:
+                    node.min_val = node.max_val = None
+
+            # Caso 2: Base U=2
+            elif node.U == 2:
+                node.min_val = 1 if x == 0 else 0
+                node.max_val = node.min_val
+
+            # Caso 3: Removendo o mínimo
+            elif x == node.min_val:
+                first_cluster_idx = node.summary.min_val
+
+                # Se não há clusters, o único outro elemento é o max_val
+                if first_cluster_idx is None:
+                    node.min_val = node.max_val
+                else:
+                    # O novo min é o min do primeiro cluster, que será
+                    # removido de lá na próxima volta do laço
+                    h = first_cluster_idx
+                    l = node.clusters[h].min_val
+                    x = node.min_val = h * node.l_sqrt_U + l
+
+            # Caso 4: Remoção normal
             else:
-                # O novo max é o max do último cluster 
-                new_max_low = self.clusters[last_cluster_idx].get_max()
-                self.max_val = self.index(last_cluster_idx, new_max_low)
+                h = x // node.l_sqrt_U
+                if h in node.clusters:
+                    l = x % node.l_sqrt_U
+                else:
+                    h = None # Item não existe
+
+            # --- Descida (para Casos 3 e 4) ---
+            if h is not None:
+                path.append((node, h, x, False))
+                node = node.clusters[h]
+                x = l
+                continue
+
+            # --- Subida: limpeza dos níveis pendentes ---
+            while path:
+                node, h, x, summary_done = path.pop()
+
+                # Caso 5: Cluster ficou vazio, remove 'h' do summary antes
+                # de terminar este nível
+                if not summary_done and node.clusters[h].min_val is None:
+                    del node.clusters[h]
+                    path.append((node, h, x, True))
+                    break
+
+                # Atualização do Max (se necessário)
+                if x == node.max_val:
+                    last_cluster_idx = node.summary.max_val
+
+                    # Se não há mais clusters, o único elemento é o min_val
+                    if last_cluster_idx is None:
+                        node.max_val = node.min_val
+                    else:
+                        # O novo max é o max do último cluster
+                        new_max_low = node.clusters[last_cluster_idx].max_val
+                        node.max_val = last_cluster_idx * node.l_sqrt_U + new_max_low
+            else:
+                return
+
+            # Continua a descida pelo summary, removendo 'h'
+            node = node.summary
+            x = h
 
     def extract_min(self):
-       
+
         if self.min_val is None:
             return None
 
         min_to_return = self.min_val
 
-        # 1. Se min == max, a árvore fica vazia 
-        if self.min_val == self.max_val:
+        # Modo multiset: só remove o min da árvore na última cópia
+        counts = self._counts
+        if counts is not None:
+            c = counts[min_to_return]
+            if c > 1:
+                counts[min_to_return] = c - 1
+                return min_to_return
+            del counts[min_to_return]
+
+        # Pilha de (nó, índice do primeiro cluster) visitados na descida
+        path = []
+        node = self
+        while True:
+            # 1. Se min == max, o nó fica vazio
+            if node.min_val == node.max_val:
+                node.min_val = node.max_val = None
+
+            # 2. Caso Base U=2
+            elif node.U == 2:
+                node.min_val = node.max_val # O min se torna o max (que era 1)
+
+            else:
+                # 3. Encontrar o próximo menor elemento
+                first_cluster_idx = node.summary.min_val
+
+                # Se summary está vazio, só tínhamos min_val e max_val
+                if first_cluster_idx is None:
+                    node.min_val = node.max_val # O novo min é o max
+                else:
+                    # 4. O novo min_val é o menor elemento do primeiro
+                    # cluster, que é extraído na próxima volta do laço
+                    cluster = node.clusters[first_cluster_idx]
+                    node.min_val = first_cluster_idx * node.l_sqrt_U + cluster.min_val
+                    path.append((node, first_cluster_idx))
+                    node = cluster
+                    continue
+
+            # 5. Limpeza: Se o cluster ficou vazio, remove-o e extrai o
+            # mínimo do summary (que é o índice desse cluster)
+            while path:
+                node, first_cluster_idx = path.pop()
+                if node.clusters[first_cluster_idx].min_val is None:
+                    del node.clusters[first_cluster_idx]
+                    node = node.summary
+                    break
+            else:
+                return min_to_return
+
+    # --- Iteração Ordenada ---
+
+    def iter_range(self, lo, hi, reverse=False):
+        """
+        Percorre as chaves do intervalo [lo, hi) em ordem crescente (ou
+        decrescente, com reverse=True). Cada nível visita só os clusters
+        não vazios do intervalo, obtidos pelo summary, e cada chave é
+        gerada uma única vez, no nó em que está: varrer k chaves custa
+        O(k) mais a descida pelas pontas do intervalo, em vez de k
+        chamadas a successor de O(lg lg U) cada.
+        No modo multiset, cada chave aparece tantas vezes quanto a sua
+        contagem.
+        """
+        lo = max(lo, 0)
+        hi = min(hi, self.U) - 1
+        if lo > hi:
+            return iter(())
+        keys = self._iter_desc(lo, hi) if reverse else self._iter_asc(lo, hi)
+        if self._counts is not None:
+            return self._repeat_counts(keys)
+        return keys
+
+    def _repeat_counts(self, keys):
+        counts = self._counts
+        for k in keys:
+            for _ in range(counts[k]):
+                yield k
+
+    def count_range(self, lo, hi):
+        """Conta as chaves do intervalo [lo, hi), percorrendo-as com iter_range."""
+        count = 0
+        for _ in self.iter_range(lo, hi):
+            count += 1
+        return count
+
+    def __iter__(self):
+        return self.iter_range(0, self.U)
+
+    def __reversed__(self):
+        return self.iter_range(0, self.U, reverse=True)
+
+    def _iter_asc(self, lo, hi):
+        # Gera as chaves em [lo, hi] (inclusivo) em ordem crescente. A
+        # descida usa uma pilha explícita de níveis abertos, cada um com o
+        # iterador dos seus clusters (pelo summary) e o deslocamento
+        # acumulado: cada chave é gerada uma vez, no nó em que está, em vez
+        # de subir por um gerador em cada nível
+        min_val = self.min_val
+        if min_val is None or min_val > hi or self.max_val < lo:
+            return
+
+        # O min não está nos clusters, então sai primeiro
+        if min_val >= lo:
+            yield min_val
+
+        if self.U == 2:
+            if self.max_val != min_val and self.max_val <= hi:
+                yield self.max_val
+            return
+
+        stack = []
+        l_sqrt_U = self.l_sqrt_U
+        h_lo = lo // l_sqrt_U
+        h_hi = hi // l_sqrt_U
+        level = (self.summary._iter_asc(h_lo, h_hi), self.clusters,
+                 0, l_sqrt_U, lo, hi, h_lo, h_hi, None)
+        while True:
+            highs, clusters, base, l_sqrt_U, lo, hi, h_lo, h_hi, _ = level
+            for h in highs:
+                offset = h * l_sqrt_U
+                node = clusters[h]
+                c_lo = lo - offset if h == h_lo else 0
+                c_hi = hi - offset if h == h_hi else l_sqrt_U - 1
+                min_val = node.min_val
+                max_val = node.max_val
+                if min_val > c_hi or max_val < c_lo:
+                    continue
+
+                if min_val >= c_lo:
+                    yield base + offset + min_val
+                if min_val == max_val:
+                    continue
+                if node.U == 2:
+                    if max_val <= c_hi:
+                        yield base + offset + max_val
+                    continue
+
+                # Desce para o cluster; este nível continua depois dele
+                stack.append(level)
+                l_sqrt_U = node.l_sqrt_U
+                h_lo = c_lo // l_sqrt_U
+                h_hi = c_hi // l_sqrt_U
+                level = (node.summary._iter_asc(h_lo, h_hi), node.clusters,
+                         base + offset, l_sqrt_U, c_lo, c_hi, h_lo, h_hi, None)
+                break
+            else:
+                if not stack:
+                    return
+                level = stack.pop()
+
+    def _iter_desc(self, lo, hi):
+        # Gera as chaves em [lo, hi] (inclusivo) em ordem decrescente, com
+        # a mesma pilha de _iter_asc. O min de cada nó não está nos
+        # clusters, então sai por último, quando o seu nível é fechado
+        min_val = self.min_val
+        if min_val is None or min_val > hi or self.max_val < lo:
+            return
+
+        if self.U == 2:
+            if self.max_val != min_val and self.max_val <= hi:
+                yield self.max_val
+            if min_val >= lo:
+                yield min_val
+            return
+
+        stack = []
+        l_sqrt_U = self.l_sqrt_U
+        h_lo = lo // l_sqrt_U
+        h_hi = hi // l_sqrt_U
+        own_min = min_val if min_val >= lo else None
+        level = (self.summary._iter_desc(h_lo, h_hi), self.clusters,
+                 0, l_sqrt_U, lo, hi, h_lo, h_hi, own_min)
+        while True:
+            highs, clusters, base, l_sqrt_U, lo, hi, h_lo, h_hi, own_min = level
+            for h in highs:
+                offset = h * l_sqrt_U
+                node = clusters[h]
+                c_lo = lo - offset if h == h_lo else 0
+                c_hi = hi - offset if h == h_hi else l_sqrt_U - 1
+                min_val = node.min_val
+                max_val = node.max_val
+                if min_val > c_hi or max_val < c_lo:
+                    continue
+
+                if min_val == max_val:
+                    yield base + offset + min_val
+                    continue
+                if node.U == 2:
+                    if max_val <= c_hi:
+                        yield base + offset + max_val
+                    if min_val >= c_lo:
+                        yield base + offset + min_val
+                    continue
+
+                stack.append(level)
+                l_sqrt_U = node.l_sqrt_U
+                h_lo = c_lo // l_sqrt_U
+                h_hi = c_hi // l_sqrt_U
+                c_min = base + offset + min_val if min_val >= c_lo else None
+                level = (node.summary._iter_desc(h_lo, h_hi), node.clusters,
+                         base + offset, l_sqrt_U, c_lo, c_hi, h_lo, h_hi, c_min)
+                break
+            else:
+                if own_min is not None:
+                    yield own_min
+                if not stack:
+                    return
+                level = stack.pop()
+
+    # --- Remoção em Lote ---
+
+    def extract_min_k(self, k):
+        """
+        Remove as k menores chaves e devolve-as em ordem crescente.
+        Localiza a k-ésima chave por iteração e remove o intervalo
+        inteiro de uma vez com delete_range.
+        """
+        if k <= 0 or self.min_val is None:
+            return []
+
+        counts = self._counts
+        if counts is None:
+            removed = list(islice(self._iter_asc(0, self.U - 1), k))
+            self._remove_range(removed[0], removed[-1], 0, None)
+            return removed
+
+        # Modo multiset: a última chave pode sair só em parte
+        result = []
+        last_full = None
+        for key in self._iter_asc(0, self.U - 1):
+            c = counts[key]
+            take = min(c, k - len(result))
+            result.extend([key] * take)
+            if take == c:
+                last_full = key
+            else:
+                counts[key] = c - take
+            if len(result) == k:
+                break
+        if last_full is not None:
+            for key in self._iter_asc(self.min_val, last_full):
+                del counts[key]
+            self._remove_range(self.min_val, last_full, 0, None)
+        return result
+
+    def delete_range(self, lo, hi):
+        """
+        Remove todas as chaves do intervalo [lo, hi) e devolve-as em ordem.
+        Clusters inteiramente dentro do intervalo saem de uma vez, e o
+        summary de cada nível é atualizado uma única vez.
+        """
+        lo = max(lo, 0)
+        hi = min(hi, self.U) - 1
+        removed = []
+        if lo <= hi:
+            self._remove_range(lo, hi, 0, removed)
+
+        counts = self._counts
+        if counts is not None:
+            # No modo multiset, todas as cópias saem juntas
+            expanded = []
+            for key in removed:
+                expanded.extend([key] * counts.pop(key))
+            removed = expanded
+        return removed
+
+    def delete_many(self, keys):
+        """
+        Remove várias chaves de uma vez e devolve as removidas em ordem.
+        As chaves são agrupadas por cluster; cada cluster é visitado uma
+        vez e os que ficam vazios saem do summary numa única chamada.
+        No modo multiset, cada ocorrência em keys remove uma cópia.
+        """
+        counts = self._counts
+        if counts is None:
+            keys = sorted(set(k for k in keys if 0 <= k < self.U))
+            removed = []
+            self._remove_sorted(keys, 0, removed)
+            return removed
+
+        wanted = {}
+        for key in keys:
+            wanted[key] = wanted.get(key, 0) + 1
+        removed = []
+        gone = []
+        for key in sorted(wanted):
+            c = counts.get(key)
+            if c is None:
+                continue
+            take = min(c, wanted[key])
+            removed.extend([key] * take)
+            if take == c:
+                del counts[key]
+                gone.append(key)
+            else:
+                counts[key] = c - take
+        self._remove_sorted(gone, 0, None)
+        return removed
+
+    def _remove_range(self, lo, hi, base, out):
+        # Remove as chaves em [lo, hi] (inclusivo) deste nó, anexando-as
+        # (somadas a 'base') em ordem crescente a 'out'. Com out=None as
+        # chaves não são listadas e clusters inteiros saem em O(1).
+        min_val = self.min_val
+        if min_val is None or min_val > hi or self.max_val < lo:
+            return
+
+        # Nó inteiro dentro do intervalo e sem listagem: esvazia direto
+        if out is None and lo <= min_val and self.max_val <= hi:
             self.min_val = self.max_val = None
-            return min_to_return
+            if self.U > 2:
+                self.summary = vEB(self.u_sqrt_U)
+                self.clusters = {}
+            return
+
+        remove_min = min_val >= lo
+        if remove_min and out is not None:
+            out.append(base + min_val)
 
-        # 2. Caso Base U=2 
         if self.U == 2:
-            self.min_val = self.max_val # O min se torna o max (que era 1)
-            return min_to_return # Retorna 0
+            remove_max = self.max_val != min_val and self.max_val <= hi
+            if remove_max and out is not None:
+                out.append(base + self.max_val)
+            self._remove_base(remove_min, remove_max)
+            return
 
-        # 3. Encontrar o próximo menor elemento 
-        first_cluster_idx = self.summary.get_min()
-        
-        # Se summary está vazio, só tínhamos min_val e max_val
-        if first_cluster_idx is None:
-            self.min_val = self.max_val # O novo min é o max
-            return min_to_return
-
-        # 4. O novo min_val é o menor elemento do primeiro cluster
-        # e já o removemos recursivamente 
-        new_min_low = self.clusters[first_cluster_idx].extract_min()
-        self.min_val = self.index(first_cluster_idx, new_min_low)
-        
-        # 5. Limpeza: Se o cluster ficou vazio 
-        if self.clusters[first_cluster_idx].get_min() is None:
-            self.summary.extract_min() # Remove o cluster do summary
-            del self.clusters[first_cluster_idx] # Deleta o cluster
+        l_sqrt_U = self.l_sqrt_U
+        h_lo = lo // l_sqrt_U
+        h_hi = hi // l_sqrt_U
+        clusters = self.clusters
+        emptied_lo = emptied_hi = None
+        for h in self.summary._iter_asc(h_lo, h_hi):
+            cluster = clusters[h]
+            base_h = h * l_sqrt_U
+            c_lo = lo - base_h if h == h_lo else 0
+            c_hi = hi - base_h if h == h_hi else l_sqrt_U - 1
+
+            if c_lo <= cluster.min_val and cluster.max_val <= c_hi:
+                # Cluster inteiro dentro do intervalo: sai de uma vez
+                if out is not None:
+                    for l in cluster._iter_asc(0, l_sqrt_U - 1):
+                        out.append(base + base_h + l)
+            else:
+                cluster._remove_range(c_lo, c_hi, base + base_h, out)
+                if cluster.min_val is not None:
+                    continue
+
+            del clusters[h]
+            if emptied_lo is None:
+                emptied_lo = h
+            emptied_hi = h
+
+        # Os clusters esvaziados são contíguos no summary (só os das
+        # pontas podem sobrar), então o summary é atualizado uma vez
+        if emptied_lo is not None:
+            self.summary._remove_range(emptied_lo, emptied_hi, 0, None)
+
+        self._restore_min_max(remove_min)
+
+    def _remove_sorted(self, keys, base, out):
+        # Remove deste nó as chaves da lista crescente 'keys' (locais),
+        # anexando as que existiam (somadas a 'base') a 'out' (se não for None)
+        min_val = self.min_val
+        if min_val is None or not keys:
+            return
+
+        i = bisect_left(keys, min_val)
+        remove_min = i < len(keys) and keys[i] == min_val
+        if remove_min:
+            if out is not None:
+                out.append(base + min_val)
+            i += 1
+
+        if self.U == 2:
+            remove_max = self.max_val != min_val and self.max_val in keys[i:]
+            if remove_max and out is not None:
+                out.append(base + self.max_val)
+            self._remove_base(remove_min, remove_max)
+            return
+
+        # Agrupa as chaves por cluster e visita cada cluster uma vez
+        l_sqrt_U = self.l_sqrt_U
+        clusters = self.clusters
+        emptied = []
+        n = len(keys)
+        while i < n:
+            h = keys[i] // l_sqrt_U
+            base_h = h * l_sqrt_U
+            lows = []
+            while i < n and keys[i] - base_h < l_sqrt_U:
+                lows.append(keys[i] - base_h)
+                i += 1
+
+            cluster = clusters.get(h)
+            if cluster is None:
+                continue
+            cluster._remove_sorted(lows, base + base_h, out)
+            if cluster.min_val is None:
+                del clusters[h]
+                emptied.append(h)
+
+        # Os clusters esvaziados saem do summary numa única chamada
+        if emptied:
+            self.summary._remove_sorted(emptied, 0, None)
+
+        self._restore_min_max(remove_min)
+
+    def _remove_base(self, remove_min, remove_max):
+        # Atualiza min/max de um nó U=2 depois de uma remoção em lote
+        if remove_min and (remove_max or self.max_val == self.min_val):
+            self.min_val = self.max_val = None
+        elif remove_min:
+            self.min_val = self.max_val
+        elif remove_max:
+            self.max_val = self.min_val
+
+    def _restore_min_max(self, remove_min):
+        # Refaz min/max de um nó U>2 depois de uma remoção em lote nos
+        # clusters (e do próprio min, se remove_min)
+        clusters = self.clusters
+        if remove_min:
+            first_cluster_idx = self.summary.min_val
+
+            # Sem clusters, não sobrou nada (o max também ficava neles)
+            if first_cluster_idx is None:
+                self.min_val = self.max_val = None
+                return
+
+            # O novo min sai do primeiro cluster
+            cluster = clusters[first_cluster_idx]
+            self.min_val = first_cluster_idx * self.l_sqrt_U + cluster.min_val
+            cluster.extract_min()
+            if cluster.min_val is None:
+                del clusters[first_cluster_idx]
+                self.summary.delete(first_cluster_idx)
+
+        last_cluster_idx = self.summary.max_val
+        if last_cluster_idx is None:
+            self.max_val = self.min_val
+        else:
+            self.max_val = last_cluster_idx * self.l_sqrt_U + clusters[last_cluster_idx].max_val
+
+    # --- Snapshot em Disco ---
+
+    def save(self, path):
+        """
+        Grava a árvore em um arquivo binário compacto de inteiros de 64
+        bits, que pode ser reaberto com vEB.open sem desserializar.
+
+        Cada nó ocupa: [min, max] (-1 para vazio) e, se U > 2, também
+        [posição do summary, k, k índices de cluster ordenados,
+        k posições de cluster]. Os tamanhos de cada nó vêm de U.
+        Só o conjunto de chaves é gravado (sem as contagens do multiset).
+        """
+        words = array('q', [SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.U, 0])
+        words[3] = self._serialize(words)
+        with open(path, 'wb') as f:
+            words.tofile(f)
+
+    def _serialize(self, words):
+        # Escreve o nó em pré-ordem e devolve a sua posição no arquivo
+        pos = len(words)
+        words.append(-1 if self.min_val is None else self.min_val)
+        words.append(-1 if self.max_val is None else self.max_val)
+        if self.U == 2:
+            return pos
+
+        highs = sorted(self.clusters)
+        k = len(highs)
+        words.append(0) # Posição do summary (preenchida abaixo)
+        words.append(k)
+        words.extend(highs)
+        table = len(words)
+        words.extend([0] * k)
+
+        words[pos + 2] = self.summary._serialize(words)
+        for i, h in enumerate(highs):
+            words[table + i] = self.clusters[h]._serialize(words)
+        return pos
+
+    @classmethod
+    def open(cls, path, mode="r"):
+        """
+        Abre um snapshot gravado por save() mapeado em memória.
+        Devolve um vEBSnapshot somente leitura; vários processos que abrem
+        o mesmo arquivo compartilham as páginas do page cache.
+        """
+        if mode != "r":
+            raise ValueError("snapshots da vEB só podem ser abertos com mode='r'")
+        return vEBSnapshot(path)
+
+
+class vEBSnapshot:
+    """
+    Visão somente leitura de uma vEB gravada com vEB.save().
+
+    member, successor e predecessor percorrem diretamente o buffer mapeado
+    (memoryview sobre o mmap), com a mesma lógica iterativa de vEB; os
+    clusters de cada nó são localizados por busca binária.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._words = memoryview(self._mmap).cast('q')
+
+        w = self._words
+        if len(w) < SNAPSHOT_HEADER or w[0] != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{path!r} não é um snapshot de vEB")
+        if w[1] != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"versão de snapshot não suportada: {w[1]}")
+
+        self.U = w[2]
+        self._root = w[3]
+        self.min_val = None if w[self._root] < 0 else w[self._root]
+        self.max_val = None if w[self._root + 1] < 0 else w[self._root + 1]
+
+    def close(self):
+        self._words.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Funções Auxiliares ---
+    @staticmethod
+    def _split(U):
+        # Devolve (l_sqrt_U, u_sqrt_U), como no construtor de vEB
+        half_power = (U.bit_length() - 1) // 2
+        return 1 << half_power, 1 << ((U.bit_length() - 1) - half_power)
+
+    def _cluster(self, pos, h):
+        # Posição do cluster 'h' do nó em 'pos', ou None se estiver vazio
+        w = self._words
+        k = w[pos + 3]
+        start = pos + 4
+        i = bisect_left(w[start:start + k], h)
+        if i < k and w[start + i] == h:
+            return w[start + k + i]
+        return None
+
+    # --- Operações Principais ---
+
+    def get_min(self):
+
+        return self.min_val
+
+    def get_max(self):
+
+        return self.max_val
+
+    def member(self, x):
+
+        if x < 0 or x >= self.U:
+            return False
+
+        w = self._words
+        pos = self._root
+        U = self.U
+        while True:
+            if x == w[pos] or x == w[pos + 1]:
+                return True
+            if U == 2:
+                return False
+            l_sqrt_U = self._split(U)[0]
+            pos = self._cluster(pos, x // l_sqrt_U)
+            if pos is None:
+                return False
+            x %= l_sqrt_U
+            U = l_sqrt_U
+
+    def successor(self, x):
+
+        w = self._words
+        path = []
+        pos = self._root
+        U = self.U
+        while True:
+            # Caso base U=2
+            if U == 2:
+                result = 1 if x == 0 and w[pos + 1] == 1 else None
+                break
+
+            # Se x < min, sucessor é o min
+            min_val = w[pos]
+            if min_val >= 0 and x < min_val:
+                result = min_val
+                break
+
+            l_sqrt_U, u_sqrt_U = self._split(U)
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+
+            # Desce pelo cluster de x ou pelo summary
+            cluster = self._cluster(pos, h)
+            if cluster is not None and l < w[cluster + 1]:
+                path.append((pos, l_sqrt_U, h))
+                pos, x, U = cluster, l, l_sqrt_U
+            else:
+                path.append((pos, l_sqrt_U, None))
+                pos, x, U = w[pos + 2], h, u_sqrt_U
+
+        while path:
+            pos, l_sqrt_U, h = path.pop()
+            if h is not None:
+                result = h * l_sqrt_U + result
+            elif result is not None:
+                result = result * l_sqrt_U + w[self._cluster(pos, result)]
+        return result
+
+    def predecessor(self, x):
+
+        w = self._words
+        path = []
+        pos = self._root
+        U = self.U
+        while True:
+            # Caso base U=2
+            if U == 2:
+                result = 0 if x == 1 and w[pos] == 0 else None
+                break
+
+            # Se x > max, predecessor é o max
+            max_val = w[pos + 1]
+            if max_val >= 0 and x > max_val:
+                result = max_val
+                break
+
+            l_sqrt_U, u_sqrt_U = self._split(U)
+            h = x // l_sqrt_U
+            l = x % l_sqrt_U
+
+            # Desce pelo cluster de x ou pelo summary
+            cluster = self._cluster(pos, h)
+            if cluster is not None and l > w[cluster]:
+                path.append((pos, l_sqrt_U, h, x))
+                pos, x, U = cluster, l, l_sqrt_U
+            else:
+                path.append((pos, l_sqrt_U, None, x))
+                pos, x, U = w[pos + 2], h, u_sqrt_U
 
-        return min_to_return
\ No newline at end of file
+        while path:
+            pos, l_sqrt_U, h, x = path.pop()
+            if h is not None:
+                result = h * l_sqrt_U + result
+            elif result is not None:
+                result = result * l_sqrt_U + w[self._cluster(pos, result) + 1]
+            elif w[pos] >= 0 and x > w[pos]:
+                result = w[pos]
+        return result
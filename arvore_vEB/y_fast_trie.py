@@ -0,0 +1,227 @@
+from bisect import bisect_left, bisect_right
+
+
+class YFastTrie:
+    """
+    Y-fast trie: mesma API de vEB (insert, delete, member, successor,
+    predecessor, extract_min, get_min, get_max), mas com espaço O(n).
+
+    As chaves ficam em baldes ordenados de Θ(w) elementos, onde w = lg U.
+    Cada balde é identificado por um representante (o limite inferior das
+    chaves do balde), e os representantes ficam numa x-fast trie: uma
+    tabela hash por nível com os prefixos presentes e o menor/maior
+    representante abaixo de cada prefixo. Encontrar o balde de x é uma
+    busca binária sobre os w níveis, O(lg lg U) esperado; o balde é
+    tratado com bisect em uma lista Python.
+
+    O representante 0 existe sempre, então todo x no universo tem balde.
+    """
+
+    def __init__(self, universe_size):
+        # Arredonda U para a próxima potência de 2 (mesma regra de vEB)
+        if universe_size <= 2:
+            self.U = 2
+        else:
+            self.U = 1 << (universe_size - 1).bit_length()
+        self.w = self.U.bit_length() - 1 # Bits por chave
+
+        # x-fast trie: levels[d] mapeia prefixo de d bits -> [min, max]
+        # dos representantes abaixo dele
+        self.levels = [{} for _ in range(self.w + 1)]
+        # Lista duplamente encadeada dos representantes, em ordem
+        self.next_rep = {}
+        self.prev_rep = {}
+        # Baldes: representante -> lista ordenada de chaves
+        self.buckets = {}
+        self.n = 0
+
+        # Limites de tamanho dos baldes, Θ(w)
+        self.bucket_max = 2 * self.w
+        self.bucket_min = max(1, self.w // 4)
+
+        self._insert_rep(0)
+        self.buckets[0] = []
+
+    def __len__(self):
+        return self.n
+
+    # --- Funções Auxiliares (x-fast trie) ---
+
+    def _floor_rep(self, x):
+        # Maior representante <= x
+        levels = self.levels
+        w = self.w
+
+        # Busca binária pelo maior prefixo de x presente na trie
+        lo, hi = 0, w
+        while lo < hi:
+            mid = (lo + hi + 1) >> 1
+            if (x >> (w - mid)) in levels[mid]:
+                lo = mid
+            else:
+                hi = mid - 1
+        if lo == w:
+            return x
+
+        entry = levels[lo][x >> (w - lo)]
+        if (x >> (w - lo - 1)) & 1:
+            # x vai para a direita, mas só existe a subárvore esquerda:
+            # todos os representantes abaixo do prefixo são menores
+            return entry[1]
+        # Só existe a subárvore direita: todos são maiores que x
+        return self.prev_rep[entry[0]]
+
+    def _insert_rep(self, r):
+        # Encadeia r entre o seu predecessor e o sucessor dele
+        pred = self._floor_rep(r) if self.next_rep else None
+        succ = None if pred is None else self.next_rep[pred]
+        self.prev_rep[r] = pred
+        self.next_rep[r] = succ
+        if pred is not None:
+            self.next_rep[pred] = r
+        if succ is not None:
+            self.prev_rep[succ] = r
+
+        # Marca todos os prefixos de r, atualizando min/max de cada um
+        w = self.w
+        for d, level in enumerate(self.levels):
+            entry = level.get(r >> (w - d))
+            if entry is None:
+                level[r >> (w - d)] = [r, r]
+            elif r < entry[0]:
+                entry[0] = r
+            elif r > entry[1]:
+                entry[1] = r
+
+    def _delete_rep(self, r):
+        pred = self.prev_rep.pop(r)
+        succ = self.next_rep.pop(r)
+
+        # Remove os prefixos que só tinham r; nos demais, o min/max
+        # passa para o vizinho de r (que está abaixo do mesmo prefixo)
+        w = self.w
+        for d, level in enumerate(self.levels):
+            p = r >> (w - d)
+            entry = level[p]
+            if entry[0] == entry[1]:
+                del level[p]
+            elif entry[0] == r:
+                entry[0] = succ
+            elif entry[1] == r:
+                entry[1] = pred
+
+        if pred is not None:
+            self.next_rep[pred] = succ
+        if succ is not None:
+            self.prev_rep[succ] = pred
+
+    # --- Funções Auxiliares (baldes) ---
+
+    def _split(self, r):
+        # Divide o balde de r ao meio; a metade de cima ganha como
+        # representante a sua menor chave
+        bucket = self.buckets[r]
+        half = len(bucket) // 2
+        upper = bucket[half:]
+        del bucket[half:]
+        self.buckets[upper[0]] = upper
+        self._insert_rep(upper[0])
+
+    def _merge(self, r):
+        # Junta o balde de r com um vizinho; o representante 0 nunca sai
+        pred = self.prev_rep[r]
+        if pred is not None:
+            target, gone = pred, r
+        else:
+            target, gone = r, self.next_rep[r]
+        self.buckets[target].extend(self.buckets.pop(gone))
+        self._delete_rep(gone)
+        if len(self.buckets[target]) > self.bucket_max:
+            self._split(target)
+
+    # --- Operações Principais ---
+
+    def get_min(self):
+
+        bucket = self.buckets[0]
+        return bucket[0] if bucket else None
+
+    def get_max(self):
+
+        # O maior representante está na raiz da x-fast trie
+        bucket = self.buckets[self.levels[0][0][1]]
+        return bucket[-1] if bucket else None
+
+    def member(self, x):
+
+        if x < 0 or x >= self.U:
+            return False
+        bucket = self.buckets[self._floor_rep(x)]
+        i = bisect_left(bucket, x)
+        return i < len(bucket) and bucket[i] == x
+
+    def insert(self, x):
+
+        r = self._floor_rep(x)
+        bucket = self.buckets[r]
+        i = bisect_left(bucket, x)
+        if i < len(bucket) and bucket[i] == x:
+            return
+        bucket.insert(i, x)
+        self.n += 1
+        if len(bucket) > self.bucket_max:
+            self._split(r)
+
+    def delete(self, x):
+
+        if x < 0 or x >= self.U:
+            return
+        r = self._floor_rep(x)
+        bucket = self.buckets[r]
+        i = bisect_left(bucket, x)
+        if i == len(bucket) or bucket[i] != x:
+            return
+        del bucket[i]
+        self.n -= 1
+        if len(bucket) < self.bucket_min and len(self.buckets) > 1:
+            self._merge(r)
+
+    def successor(self, x):
+
+        if x < 0:
+            return self.get_min()
+        if x >= self.U:
+            return None
+        r = self._floor_rep(x)
+        bucket = self.buckets[r]
+        i = bisect_right(bucket, x)
+        if i < len(bucket):
+            return bucket[i]
+        # Com mais de um balde, nenhum balde fica vazio
+        succ = self.next_rep[r]
+        return None if succ is None else self.buckets[succ][0]
+
+    def predecessor(self, x):
+
+        if x <= 0:
+            return None
+        if x >= self.U:
+            return self.get_max()
+        r = self._floor_rep(x)
+        bucket = self.buckets[r]
+        i = bisect_left(bucket, x)
+        if i > 0:
+            return bucket[i - 1]
+        pred = self.prev_rep[r]
+        return None if pred is None else self.buckets[pred][-1]
+
+    def extract_min(self):
+
+        bucket = self.buckets[0]
+        if not bucket:
+            return None
+        min_to_return = bucket.pop(0)
+        self.n -= 1
+        if len(bucket) < self.bucket_min and len(self.buckets) > 1:
+            self._merge(0)
+        return min_to_return
@@ -0,0 +1,48 @@
+import heapq
+import math
+
+from dijkstra_bidirecional import reconstruir_caminho
+
+def a_estrela_baseline_heapq(G, source, target, heuristica):
+    # A* com heapq (ver a_estrela_com_fibonacci): cada melhora de g empilha
+    # uma nova entrada (f, v) e as obsoletas são descartadas ao sair.
+    # Devolve (distancia, caminho, counts).
+
+    counts = {
+        'extract_min': 0,
+        'insert_relax': 0
+    }
+
+    g = {source: 0}
+    predecessores = {source: None}
+    finalizados = set()
+    H = [(heuristica(source), source)]
+
+    while H:
+
+        counts['extract_min'] += 1
+        (_, u) = heapq.heappop(H)
+
+        if u in finalizados:
+            continue
+        if u == target:
+            return g[u], reconstruir_caminho(predecessores, source, target), counts
+        finalizados.add(u)
+
+        if u not in G:
+            continue
+
+        g_u = g[u]
+        for v, peso in G[u]:
+            if v in finalizados:
+                continue
+            novo_g = g_u + peso
+
+            if novo_g < g.get(v, math.inf):
+                g[v] = novo_g
+                predecessores[v] = u
+
+                counts['insert_relax'] += 1
+                heapq.heappush(H, (novo_g + heuristica(v), v))
+
+    return math.inf, [], counts
\ No newline at end of file
@@ -0,0 +1,63 @@
+from fibonacci_heap import FibonacciHeap
+from dijkstra_bidirecional import reconstruir_caminho
+import math
+
+def a_estrela_com_fibonacci(G, source, target, heuristica, heap_cls=FibonacciHeap):
+    # A*: Dijkstra ordenado por f(v) = g(v) + heuristica(v), onde g é a
+    # distância conhecida desde source e heuristica(v) estima a distância
+    # de v até target. Com uma heurística consistente (nunca superestima e
+    # respeita a desigualdade triangular, ex.: Manhattan numa grade com
+    # peso mínimo 1) cada vértice é finalizado uma vez, e o resultado é o
+    # mesmo do Dijkstra visitando menos vértices. heuristica = 0 é o próprio
+    # Dijkstra com target.
+    #
+    # Vértices entram no heap ao serem alcançados; melhoras de g viram
+    # DECREASE-KEY (o h de um vértice não muda). Devolve
+    # (distancia, caminho, counts); distancia = inf e caminho = [] se target
+    # não é alcançável.
+
+    counts = {
+        'extract_min': 0,
+        'insert': 0,
+        'decrease_key': 0
+    }
+
+    g = {source: 0}
+    predecessores = {source: None}
+    finalizados = set()
+
+    H = heap_cls()
+    node_map = {source: H.insert(key=heuristica(source), payload=source)}
+    counts['insert'] += 1
+
+    while H.min is not None:
+
+        counts['extract_min'] += 1
+        u = H.extract_min().payload
+        del node_map[u]
+        if u == target:
+            return g[u], reconstruir_caminho(predecessores, source, target), counts
+        finalizados.add(u)
+
+        if u not in G:
+            continue
+
+        g_u = g[u]
+        for v, peso in G[u]:
+            if v in finalizados:
+                continue
+            novo_g = g_u + peso
+
+            if novo_g < g.get(v, math.inf):
+                g[v] = novo_g
+                predecessores[v] = u
+
+                node = node_map.get(v)
+                if node is None:
+                    counts['insert'] += 1
+                    node_map[v] = H.insert(key=novo_g + heuristica(v), payload=v)
+                else:
+                    counts['decrease_key'] += 1
+                    H.decrease_key(node, novo_g + heuristica(v))
+
+    return math.inf, [], counts
\ No newline at end of file
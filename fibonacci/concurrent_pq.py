@@ -0,0 +1,287 @@
+"""
+Thread-safe and asyncio front-ends for the priority queues in this repo.
+
+Both queues wrap an existing, empty structure and only use its public
+operations, so they work over either of:
+
+- fibonacci_heap.FibonacciHeap (any comparable priority), or
+- vEB_tree.vEB (integer priorities in [0, U-1]).
+
+put(item, priority) returns a PQEntry handle; pass it to decrease_priority
+to lower the priority of an item that is still queued. get() returns
+(item, priority) with the smallest priority.
+
+ThreadSafePriorityQueue: producers never touch the heap. put() appends to a
+staging deque (atomic in CPython) and releases a semaphore that counts
+queued items. A consumer takes the semaphore, then holds the heap lock just
+long enough to move the whole staged batch into the heap and pop the min, so
+producers do not serialize behind consumers or behind each other.
+
+AsyncPriorityQueue: for one event loop, with put_threadsafe() for producer
+threads. Those also go through a staging deque; the loop is woken at most
+once per batch rather than once per item.
+"""
+
+from __future__ import annotations
+from collections import deque
+from typing import Any, Optional, Tuple
+import asyncio
+import queue
+import threading
+
+
+class PQEntry:
+    __slots__ = ("item", "priority", "_handle", "_queued")
+
+    def __init__(self, item: Any, priority: Any):
+        self.item = item
+        self.priority = priority
+        # backend handle (the heap Node) while the entry is in the heap
+        self._handle: Any = None
+        self._queued = True
+
+    def __repr__(self) -> str:
+        return f"PQEntry(item={self.item!r}, priority={self.priority!r})"
+
+
+# -------------------- backends --------------------
+class _HeapBackend:
+    """Adapter for addressable heaps with FibonacciHeap's API."""
+
+    def __init__(self, heap):
+        self.heap = heap
+
+    def __len__(self) -> int:
+        return self.heap.n
+
+    def push(self, entry: PQEntry) -> None:
+        entry._handle = self.heap.insert(entry.priority, entry)
+
+    def pop(self) -> PQEntry:
+        entry = self.heap.extract_min().payload
+        entry._handle = None
+        return entry
+
+    def decrease(self, entry: PQEntry, priority: Any) -> None:
+        self.heap.decrease_key(entry._handle, priority)
+        entry.priority = priority
+
+
+class _VEBBackend:
+    """Adapter for vEB: the tree holds the distinct priorities and each
+    priority maps to an insertion-ordered dict of its entries (FIFO ties).
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.buckets = {}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, entry: PQEntry) -> None:
+        p = entry.priority
+        bucket = self.buckets.get(p)
+        if bucket is None:
+            bucket = self.buckets[p] = {}
+            self.tree.insert(p)
+        bucket[entry] = None
+        self.size += 1
+
+    def _unlink(self, entry: PQEntry) -> None:
+        p = entry.priority
+        bucket = self.buckets[p]
+        del bucket[entry]
+        if not bucket:
+            del self.buckets[p]
+            self.tree.delete(p)
+        self.size -= 1
+
+    def pop(self) -> PQEntry:
+        entry = next(iter(self.buckets[self.tree.get_min()]))
+        self._unlink(entry)
+        return entry
+
+    def decrease(self, entry: PQEntry, priority: Any) -> None:
+        self._unlink(entry)
+        entry.priority = priority
+        self.push(entry)
+
+
+def _make_backend(structure):
+    # the structure must start empty: items already in it have no entry
+    if hasattr(structure, "decrease_key"):
+        if structure.min is not None:
+            raise ValueError("the wrapped heap must be empty")
+        return _HeapBackend(structure)
+    if hasattr(structure, "successor"):
+        if structure.min_val is not None:
+            raise ValueError("the wrapped vEB must be empty")
+        return _VEBBackend(structure)
+    raise TypeError("expected a FibonacciHeap-like heap or a vEB tree")
+
+
+def _check_decrease(entry: PQEntry, priority: Any) -> None:
+    if not entry._queued:
+        raise ValueError("entry is no longer in the queue")
+    if priority > entry.priority:
+        raise ValueError("new priority is greater than current priority")
+
+
+# -------------------- thread-safe queue --------------------
+class ThreadSafePriorityQueue:
+    def __init__(self, structure):
+        self._backend = _make_backend(structure)
+        self._staging: deque = deque()
+        self._available = threading.Semaphore(0)  # items staged or in heap
+        self._lock = threading.Lock()  # guards the backend
+
+    def qsize(self) -> int:
+        """Approximate number of queued items."""
+        return len(self._staging) + len(self._backend)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def put(self, item: Any, priority: Any) -> PQEntry:
+        """Queue an item without waiting for the heap lock."""
+        entry = PQEntry(item, priority)
+        self._staging.append(entry)
+        self._available.release()
+        return entry
+
+    def _drain(self) -> None:
+        # move every staged entry into the backend (heap lock held)
+        staging, push = self._staging, self._backend.push
+        while staging:
+            push(staging.popleft())
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Tuple[Any, Any]:
+        """Remove and return (item, priority) with the smallest priority.
+
+        Raises queue.Empty if no item arrives (non-blocking or timeout).
+        """
+        if not self._available.acquire(block, timeout):
+            raise queue.Empty
+        with self._lock:
+            self._drain()
+            entry = self._backend.pop()
+            entry._queued = False
+        return entry.item, entry.priority
+
+    def get_nowait(self) -> Tuple[Any, Any]:
+        return self.get(block=False)
+
+    def decrease_priority(self, entry: PQEntry, priority: Any) -> None:
+        """Lower the priority of a queued entry."""
+        with self._lock:
+            self._drain()
+            _check_decrease(entry, priority)
+            self._backend.decrease(entry, priority)
+
+
+# -------------------- asyncio queue --------------------
+class AsyncPriorityQueue:
+    def __init__(self, structure):
+        self._backend = _make_backend(structure)
+        self._getters: deque = deque()  # futures of waiting get() calls
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None  # bound on first use inside the loop
+        # handoff from producer threads
+        self._staging: deque = deque()
+        self._drain_lock = threading.Lock()
+        self._drain_pending = False
+
+    def qsize(self) -> int:
+        """Approximate number of queued items."""
+        return len(self._staging) + len(self._backend)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def _wakeup_next(self) -> None:
+        while self._getters:
+            fut = self._getters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+
+    def _push(self, entry: PQEntry) -> None:
+        self._backend.push(entry)
+        self._wakeup_next()
+
+    def _drain(self) -> None:
+        # runs in the loop; clear the flag first so that a producer that
+        # appends after this point schedules another drain
+        with self._drain_lock:
+            self._drain_pending = False
+        staging = self._staging
+        while staging:
+            self._push(staging.popleft())
+
+    def put_nowait(self, item: Any, priority: Any) -> PQEntry:
+        self._bind_loop()
+        entry = PQEntry(item, priority)
+        self._push(entry)
+        return entry
+
+    async def put(self, item: Any, priority: Any) -> PQEntry:
+        """Queue an item (never blocks: the queue is unbounded)."""
+        return self.put_nowait(item, priority)
+
+    def put_threadsafe(self, item: Any, priority: Any) -> PQEntry:
+        """Queue an item from another thread. The loop is woken at most once
+        for all items staged before it runs the drain.
+        """
+        if self._loop is None:
+            raise RuntimeError("queue is not bound to an event loop yet")
+        entry = PQEntry(item, priority)
+        self._staging.append(entry)
+        with self._drain_lock:
+            if self._drain_pending:
+                return entry
+            self._drain_pending = True
+        self._loop.call_soon_threadsafe(self._drain)
+        return entry
+
+    def get_nowait(self) -> Tuple[Any, Any]:
+        if self._staging:
+            self._drain()
+        if not len(self._backend):
+            raise asyncio.QueueEmpty
+        entry = self._backend.pop()
+        entry._queued = False
+        return entry.item, entry.priority
+
+    async def get(self) -> Tuple[Any, Any]:
+        """Remove and return (item, priority), waiting until one is queued."""
+        loop = self._bind_loop()
+        if self._staging:
+            self._drain()
+        while not len(self._backend):
+            fut = loop.create_future()
+            self._getters.append(fut)
+            try:
+                await fut
+            except BaseException:
+                fut.cancel()
+                # pass the wakeup on if this getter was woken and cancelled
+                if len(self._backend) and not fut.cancelled():
+                    self._wakeup_next()
+                raise
+        return self.get_nowait()
+
+    async def decrease_priority(self, entry: PQEntry, priority: Any) -> None:
+        """Lower the priority of a queued entry."""
+        if self._staging:
+            self._drain()
+        _check_decrease(entry, priority)
+        self._backend.decrease(entry, priority)
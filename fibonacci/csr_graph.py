@@ -0,0 +1,145 @@
+"""
+Compressed sparse row (CSR) graph for the Dijkstra implementations.
+
+The adjacency dict used by run_benchmarks.py ({u: [(v, peso), ...]}) costs
+one tuple per edge plus one list per vertex. CSRGraph keeps the same graph
+in three flat arrays from the standard library's array module:
+
+- offsets[u] .. offsets[u+1] is the slice of edges leaving u ('q', V+1);
+- targets[i] is the head of edge i ('q', E);
+- weights[i] is its weight ('d', E).
+
+Vertices are the integers 0..V-1. When the graph is built from a dict whose
+keys are not already 0..V-1, labels[i] holds the original key of vertex i.
+
+Both dijkstra_com_fibonacci and dijkstra_baseline_heapq accept a CSRGraph
+and then return array('d') distances (inf when unreachable) and array('q')
+predecessors (-1 for none), indexed by vertex.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class CSRGraph:
+    __slots__ = ("offsets", "targets", "weights", "labels")
+
+    def __init__(self, offsets: array, targets: array, weights: array,
+                 labels: Optional[List[Any]] = None):
+        if len(targets) != len(weights) or offsets[-1] != len(targets):
+            raise ValueError("offsets, targets and weights do not match")
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Number of stored (directed) edges."""
+        return len(self.targets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.offsets) - 1))
+
+    def __contains__(self, u: Any) -> bool:
+        return isinstance(u, int) and 0 <= u < len(self.offsets) - 1
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbors(self, u: int) -> Iterator[Tuple[int, float]]:
+        """Iterate over the (v, weight) pairs of the edges leaving u."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def __getitem__(self, u: int) -> Iterator[Tuple[int, float]]:
+        # same shape as the adjacency dict: G[u] -> (v, peso) pairs
+        return self.neighbors(u)
+
+    # -------------------- construction --------------------
+    @classmethod
+    def from_adjacency(cls, G: Dict[Any, Iterable[Tuple[Any, float]]]) -> "CSRGraph":
+        """Convert an adjacency dict {u: [(v, peso), ...]} into CSR.
+
+        Vertex i is the i-th key of G. If the keys are not exactly
+        0..V-1 in that order, they are kept in labels.
+        """
+        keys = list(G)
+        if all(k == i for i, k in enumerate(keys)):
+            index = None
+            labels = None
+        else:
+            index = {k: i for i, k in enumerate(keys)}
+            labels = keys
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for u in keys:
+            for v, peso in G[u]:
+                targets.append(v if index is None else index[v])
+                weights.append(peso)
+            offsets.append(len(targets))
+        return cls(offsets, targets, weights, labels)
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges: Iterable[Tuple[int, int, float]],
+                   directed: bool = False) -> "CSRGraph":
+        """Build CSR from (u, v, weight) triples over vertices 0..V-1 with a
+        counting sort by tail (O(V + E)). Undirected edges are stored in
+        both directions.
+        """
+        tails = array("q")
+        heads = array("q")
+        ws = array("d")
+        for u, v, w in edges:
+            tails.append(u)
+            heads.append(v)
+            ws.append(w)
+            if not directed:
+                tails.append(v)
+                heads.append(u)
+                ws.append(w)
+        return cls._from_arrays(num_vertices, tails, heads, ws)
+
+    @classmethod
+    def _from_arrays(cls, num_vertices: int, tails: array, heads: array,
+                     ws: array) -> "CSRGraph":
+        # counting sort of the edges by tail, stable within each vertex
+        offsets = array("q", [0]) * (num_vertices + 1)
+        for u in tails:
+            offsets[u + 1] += 1
+        for u in range(num_vertices):
+            offsets[u + 1] += offsets[u]
+
+        m = len(tails)
+        targets = array("q", [0]) * m
+        weights = array("d", [0.0]) * m
+        fill = offsets[:-1]  # next free slot of each vertex
+        for i in range(m):
+            u = tails[i]
+            j = fill[u]
+            targets[j] = heads[i]
+            weights[j] = ws[i]
+            fill[u] = j + 1
+        return cls(offsets, targets, weights)
+
+    def reverse(self) -> "CSRGraph":
+        """Return the transposed graph (every edge u->v becomes v->u)."""
+        n = self.num_vertices
+        offsets = self.offsets
+        tails = array("q", [0]) * len(self.targets)
+        for u in range(n):
+            for i in range(offsets[u], offsets[u + 1]):
+                tails[i] = u
+        G = self._from_arrays(n, self.targets, tails, self.weights)
+        G.labels = self.labels
+        return G
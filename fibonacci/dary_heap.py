@@ -0,0 +1,166 @@
+"""
+Indexed d-ary heap with a real decrease_key.
+
+The heap is stored in two parallel Python lists (keys and items), laid out
+as an implicit d-ary tree: the children of slot i are slots d*i+1 .. d*i+d.
+A dict maps every item to its current slot, so decrease_key(item, k) can
+find the item in O(1) and sift it up in O(log_d n) without leaving a stale
+copy behind (unlike heapq, where Dijkstra has to push duplicates). The heap
+therefore never holds more entries than distinct items.
+
+A larger arity makes the tree shallower (cheaper sift-up, i.e. cheaper
+insert and decrease_key) at the cost of more comparisons per level in
+sift-down (extract_min). d = 4 is the usual sweet spot.
+
+Items must be hashable and are unique: pushing an item that is already in
+the heap raises ValueError.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class IndexedDaryHeap:
+    def __init__(self, d: int = 4):
+        if d < 2:
+            raise ValueError("arity must be at least 2")
+        self.d = d
+        self._keys: List[Any] = []
+        self._items: List[Hashable] = []
+        self._pos: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._pos
+
+    def key(self, item: Hashable) -> Any:
+        """Return the current key of an item in the heap (KeyError if absent)."""
+        return self._keys[self._pos[item]]
+
+    # -------------------- sifting --------------------
+    def _sift_up(self, i: int, key: Any, item: Hashable) -> None:
+        """Place (key, item) at slot i or above, moving larger parents down."""
+        keys, items, pos, d = self._keys, self._items, self._pos, self.d
+        while i > 0:
+            p = (i - 1) // d
+            pk = keys[p]
+            if not key < pk:
+                break
+            keys[i] = pk
+            items[i] = items[p]
+            pos[items[i]] = i
+            i = p
+        keys[i] = key
+        items[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i: int, key: Any, item: Hashable) -> None:
+        """Place (key, item) at slot i or below, moving smaller children up."""
+        keys, items, pos, d = self._keys, self._items, self._pos, self.d
+        n = len(keys)
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # smallest of the (up to d) children
+            c = first
+            ck = keys[first]
+            for j in range(first + 1, min(first + d, n)):
+                if keys[j] < ck:
+                    c = j
+                    ck = keys[j]
+            if not ck < key:
+                break
+            keys[i] = ck
+            items[i] = items[c]
+            pos[items[i]] = i
+            i = c
+        keys[i] = key
+        items[i] = item
+        pos[item] = i
+
+    # -------------------- public interface --------------------
+    def push(self, item: Hashable, key: Any) -> None:
+        """Insert an item with the given key. Time: O(log_d n)."""
+        if item in self._pos:
+            raise ValueError("item already in heap")
+        self._keys.append(key)
+        self._items.append(item)
+        self._sift_up(len(self._items) - 1, key, item)
+
+    def peek(self) -> Optional[Tuple[Hashable, Any]]:
+        """Return (item, key) with the minimum key, or None if empty. O(1)."""
+        if not self._items:
+            return None
+        return self._items[0], self._keys[0]
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Remove and return (item, key) with the minimum key.
+
+        Time: O(d log_d n). Raises IndexError if the heap is empty.
+        """
+        if not self._items:
+            raise IndexError("pop from empty heap")
+        keys, items = self._keys, self._items
+        top_item, top_key = items[0], keys[0]
+        del self._pos[top_item]
+        last_key = keys.pop()
+        last_item = items.pop()
+        if items:
+            self._sift_down(0, last_key, last_item)
+        return top_item, top_key
+
+    def decrease_key(self, item: Hashable, key: Any) -> None:
+        """Lower the key of an item already in the heap. Time: O(log_d n)."""
+        i = self._pos[item]
+        if key > self._keys[i]:
+            raise ValueError("new key is greater than current key")
+        self._sift_up(i, key, item)
+
+    def push_or_decrease(self, item: Hashable, key: Any) -> bool:
+        """Insert the item, or lower its key if it is already in the heap
+        and the new key is smaller. Returns True if the heap changed.
+        """
+        i = self._pos.get(item)
+        if i is None:
+            self.push(item, key)
+            return True
+        if key < self._keys[i]:
+            self._sift_up(i, key, item)
+            return True
+        return False
+
+    def remove(self, item: Hashable) -> Any:
+        """Remove an arbitrary item and return its key. Time: O(d log_d n)."""
+        i = self._pos.pop(item)
+        keys, items = self._keys, self._items
+        removed_key = keys[i]
+        last_key = keys.pop()
+        last_item = items.pop()
+        if i < len(items):
+            # the last entry fills the hole and may need to go either way
+            if last_key < removed_key:
+                self._sift_up(i, last_key, last_item)
+            else:
+                self._sift_down(i, last_key, last_item)
+        return removed_key
+
+
+# -------------------- optional small demo when run as script --------------------
+if __name__ == "__main__":
+    H = IndexedDaryHeap(d=4)
+    H.push("a", 7)
+    H.push("b", 3)
+    H.push("c", 17)
+    print("min:", H.peek())
+    print("extracted:", H.pop())
+    print("min after extract:", H.peek())
+    H.decrease_key("c", 1)
+    print("min after decrease-key:", H.peek())
+    H.remove("c")
+    print("min after remove:", H.peek())
@@ -1,7 +1,14 @@
 import heapq
 import math
+from array import array
 
-def dijkstra_baseline_heapq(G, source):
+from csr_graph import CSRGraph
+
+def dijkstra_baseline_heapq(G, source, target=None):
+    # G pode ser um CSRGraph: aí as saídas são arrays (ver _dijkstra_csr)
+    # target: para assim que o alvo é finalizado (distância já correta)
+    if isinstance(G, CSRGraph):
+        return _dijkstra_csr(G, source, target)
 
 
     counts = {
@@ -29,6 +36,9 @@ def dijkstra_baseline_heapq(G, source):
         if dist_u > distancias[u]:
             continue
         
+        if u == target:
+            break
+
         if u not in G:
             continue
             
@@ -43,4 +53,46 @@ def dijkstra_baseline_heapq(G, source):
                 counts['insert_relax'] += 1
                 heapq.heappush(H, (nova_distancia, v))
 
+    return distancias, predecessores, counts
+
+def _dijkstra_csr(G, source, target):
+    # Mesmo algoritmo sobre o CSRGraph, com distancias em array('d')
+    # (inf = inalcançável) e predecessores em array('q') (-1 = nenhum)
+
+    counts = {
+        'extract_min': 0,
+        'insert_relax': 0
+    }
+
+    n = G.num_vertices
+    offsets, targets, weights = G.offsets, G.targets, G.weights
+    distancias = array('d', [math.inf]) * n
+    predecessores = array('q', [-1]) * n
+    H = []
+
+    distancias[source] = 0
+    heapq.heappush(H, (0, source))
+
+    while H:
+
+        counts['extract_min'] += 1
+        (dist_u, u) = heapq.heappop(H)
+
+        if dist_u > distancias[u]:
+            continue
+
+        if u == target:
+            break
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            nova_distancia = dist_u + weights[i]
+
+            if distancias[v] > nova_distancia:
+                distancias[v] = nova_distancia
+                predecessores[v] = u
+
+                counts['insert_relax'] += 1
+                heapq.heappush(H, (nova_distancia, v))
+
     return distancias, predecessores, counts
\ No newline at end of file
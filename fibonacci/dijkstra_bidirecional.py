@@ -0,0 +1,161 @@
+import heapq
+import math
+
+from fibonacci_heap import FibonacciHeap
+
+def reconstruir_caminho(predecessores, source, target):
+    # Caminho source -> target a partir dos predecessores de um Dijkstra
+    # (dicionário com None ou array com -1 para "sem predecessor").
+    # Devolve [] se target não foi alcançado.
+    caminho = [target]
+    u = target
+    while u != source:
+        try:
+            u = predecessores[u]
+        except (KeyError, IndexError):
+            return []
+        if u is None or u == -1:
+            return []
+        caminho.append(u)
+    caminho.reverse()
+    return caminho
+
+
+class _FronteiraHeapq:
+    # Fronteira com heapq: empilha duplicatas e descarta as obsoletas
+    # (mesma estratégia de dijkstra_baseline_heapq)
+
+    def __init__(self, dist, finalizados, counts):
+        self.H = []
+        self.dist = dist
+        self.finalizados = finalizados
+        self.counts = counts
+
+    def _limpar(self):
+        H = self.H
+        while H and (H[0][1] in self.finalizados or H[0][0] > self.dist[H[0][1]]):
+            heapq.heappop(H)
+
+    def menor_chave(self):
+        self._limpar()
+        return self.H[0][0] if self.H else math.inf
+
+    def push(self, v, d):
+        self.counts['insert'] += 1
+        heapq.heappush(self.H, (d, v))
+
+    def pop(self):
+        self._limpar()
+        d, v = heapq.heappop(self.H)
+        return v, d
+
+
+class _FronteiraFibonacci:
+    # Fronteira com FibonacciHeap: inserção preguiçosa + decrease-key
+
+    def __init__(self, dist, finalizados, counts):
+        self.H = FibonacciHeap()
+        self.node_map = {}
+        self.counts = counts
+
+    def menor_chave(self):
+        return math.inf if self.H.min is None else self.H.min.key
+
+    def push(self, v, d):
+        node = self.node_map.get(v)
+        if node is None:
+            self.counts['insert'] += 1
+            self.node_map[v] = self.H.insert(key=d, payload=v)
+        else:
+            self.counts['decrease_key'] += 1
+            self.H.decrease_key(node, d)
+
+    def pop(self):
+        node = self.H.extract_min()
+        del self.node_map[node.payload]
+        return node.payload, node.key
+
+
+_FRONTEIRAS = {
+    'heapq': _FronteiraHeapq,
+    'fibonacci': _FronteiraFibonacci,
+}
+
+def dijkstra_bidirecional(G, source, target, backend='heapq', G_reverso=None):
+    # Busca bidirecional: uma fronteira sai de source em G e outra sai de
+    # target em G_reverso (o grafo com as arestas invertidas; por padrão o
+    # próprio G, que nos benchmarks é não-dirigido). A cada passo avança o
+    # lado cuja fronteira tem a menor chave e para quando
+    # menor_chave(frente) + menor_chave(trás) >= mu, onde mu é o melhor
+    # caminho já visto passando por um vértice alcançado pelos dois lados.
+    # G pode ser dicionário de adjacência ou CSRGraph.
+    #
+    # Devolve (distancia, caminho, counts); distancia = inf e caminho = []
+    # se target não é alcançável.
+
+    counts = {
+        'extract_min': 0,
+        'insert': 0,
+        'decrease_key': 0
+    }
+    if source == target:
+        return 0, [source], counts
+    if G_reverso is None:
+        G_reverso = G
+    Fronteira = _FRONTEIRAS[backend]
+
+    # Índice 0 = busca para frente, 1 = busca para trás
+    grafos = (G, G_reverso)
+    dist = ({source: 0}, {target: 0})
+    pred = ({source: None}, {target: None})
+    finalizados = (set(), set())
+    fronteiras = (Fronteira(dist[0], finalizados[0], counts),
+                  Fronteira(dist[1], finalizados[1], counts))
+    fronteiras[0].push(source, 0)
+    fronteiras[1].push(target, 0)
+
+    mu = math.inf
+    meio = None
+
+    while True:
+        chave_f = fronteiras[0].menor_chave()
+        chave_b = fronteiras[1].menor_chave()
+        # Condição de parada (uma fronteira vazia também encerra)
+        if chave_f + chave_b >= mu or chave_f == math.inf or chave_b == math.inf:
+            break
+
+        lado = 0 if chave_f <= chave_b else 1
+        Gl, dist_l, pred_l = grafos[lado], dist[lado], pred[lado]
+        dist_o = dist[1 - lado]
+
+        counts['extract_min'] += 1
+        u, dist_u = fronteiras[lado].pop()
+        finalizados[lado].add(u)
+
+        if u not in Gl:
+            continue
+
+        for v, peso in Gl[u]:
+            nova_distancia = dist_u + peso
+            if nova_distancia < dist_l.get(v, math.inf):
+                dist_l[v] = nova_distancia
+                pred_l[v] = u
+                fronteiras[lado].push(v, nova_distancia)
+
+            # v já foi alcançado pelo outro lado: candidato a ponto de encontro
+            if v in dist_o:
+                candidato = dist_l[v] + dist_o[v]
+                if candidato < mu:
+                    mu = candidato
+                    meio = v
+
+    if meio is None:
+        return math.inf, [], counts
+
+    # Junta source -> meio (frente) com meio -> target (trás)
+    caminho = reconstruir_caminho(pred[0], source, meio)
+    u = pred[1][meio]
+    while u is not None:
+        caminho.append(u)
+        u = pred[1][u]
+    return mu, caminho, counts
\ No newline at end of file
@@ -1,7 +1,21 @@
 from fibonacci_heap import FibonacciHeap, Node
+from csr_graph import CSRGraph
+from array import array
 import math
 
-def dijkstra_com_fibonacci(G, source):
+def dijkstra_com_fibonacci(G, source, heap_cls=FibonacciHeap, lazy=False, target=None):
+    # heap_cls: qualquer heap com a mesma API de FibonacciHeap
+    # (PairingHeap, RankPairingHeap, ...)
+    # lazy=True: vértices só entram no heap quando são alcançados
+    # (ver _dijkstra_lazy)
+    # G pode ser um CSRGraph: aí as saídas são arrays (ver _dijkstra_csr)
+    # target: para assim que o alvo sai do heap (a distância dele já é
+    # final); os vértices ainda no heap ficam com distâncias provisórias
+
+    if isinstance(G, CSRGraph):
+        return _dijkstra_csr(G, source, heap_cls, lazy, target)
+    if lazy:
+        return _dijkstra_lazy(G, source, heap_cls, target)
 
     # Contadores para verificação de sanidade (Ponto 4 do Feedback)
     counts = {
@@ -13,7 +27,7 @@ def dijkstra_com_fibonacci(G, source):
     predecessores = {}
     node_map = {} 
     
-    H = FibonacciHeap()
+    H = heap_cls()
 
     for u in G:
         distancias[u] = math.inf
@@ -21,9 +35,15 @@ def dijkstra_com_fibonacci(G, source):
         
     distancias[source] = 0
     
-    for u in G:
-        node = H.insert(key=distancias[u], payload=u)
-        node_map[u] = node
+    # Inserção em lote quando o heap oferece (FibonacciHeap.insert_many)
+    if hasattr(H, 'insert_many'):
+        vertices = list(G)
+        nodes = H.insert_many((distancias[u], u) for u in vertices)
+        node_map = dict(zip(vertices, nodes))
+    else:
+        for u in G:
+            node = H.insert(key=distancias[u], payload=u)
+            node_map[u] = node
 
     # O laço principal do Dijkstra
     while H.min is not None:
@@ -33,6 +53,9 @@ def dijkstra_com_fibonacci(G, source):
         u_node = H.extract_min()
         u = u_node.payload
         
+        if u == target:
+            break
+
         if u not in G:
             continue
 
@@ -48,4 +71,112 @@ def dijkstra_com_fibonacci(G, source):
                 v_node_para_atualizar = node_map[v]
                 H.decrease_key(v_node_para_atualizar, nova_distancia)
 
+    return distancias, predecessores, counts
+
+def _dijkstra_lazy(G, source, heap_cls, target):
+    # Variante preguiçosa: o vértice é inserido no primeiro relaxamento e
+    # sofre decrease-key nos seguintes. O heap só guarda a fronteira e os
+    # dicionários só têm os vértices alcançados (ausente = distância
+    # infinita), então buscas que alcançam uma região pequena de um grafo
+    # enorme não pagam O(V).
+
+    counts = {
+        'extract_min': 0,
+        'decrease_key': 0,
+        'insert': 0
+    }
+
+    distancias = {source: 0}
+    predecessores = {source: None}
+
+    H = heap_cls()
+    node_map = {source: H.insert(key=0, payload=source)}
+    counts['insert'] += 1
+
+    while H.min is not None:
+
+        counts['extract_min'] += 1
+        u = H.extract_min().payload
+        del node_map[u] # Finalizado: sai da fronteira
+
+        if u == target:
+            break
+
+        if u not in G:
+            continue
+
+        dist_u = distancias[u]
+        for v, peso in G[u]:
+            nova_distancia = dist_u + peso
+
+            if nova_distancia < distancias.get(v, math.inf):
+                distancias[v] = nova_distancia
+                predecessores[v] = u
+
+                node = node_map.get(v)
+                if node is None:
+                    counts['insert'] += 1
+                    node_map[v] = H.insert(key=nova_distancia, payload=v)
+                else:
+                    counts['decrease_key'] += 1
+                    H.decrease_key(node, nova_distancia)
+
+    return distancias, predecessores, counts
+
+def _dijkstra_csr(G, source, heap_cls, lazy, target):
+    # Mesmo algoritmo sobre o CSRGraph: as arestas de u são o trecho
+    # offsets[u]..offsets[u+1] de targets/weights, sem tuplas por aresta.
+    # distancias é array('d') (inf = inalcançável) e predecessores é
+    # array('q') (-1 = sem predecessor), indexados pelo vértice.
+
+    counts = {
+        'extract_min': 0,
+        'decrease_key': 0
+    }
+    if lazy:
+        counts['insert'] = 0
+
+    n = G.num_vertices
+    offsets, targets, weights = G.offsets, G.targets, G.weights
+    distancias = array('d', [math.inf]) * n
+    predecessores = array('q', [-1]) * n
+    distancias[source] = 0
+
+    H = heap_cls()
+    if lazy:
+        node_map = [None] * n
+        node_map[source] = H.insert(key=0, payload=source)
+        counts['insert'] += 1
+    elif hasattr(H, 'insert_many'):
+        node_map = H.insert_many((distancias[u], u) for u in range(n))
+    else:
+        node_map = [H.insert(key=distancias[u], payload=u) for u in range(n)]
+
+    while H.min is not None:
+
+        counts['extract_min'] += 1
+        u = H.extract_min().payload
+        node_map[u] = None # Finalizado
+
+        if u == target:
+            break
+
+        dist_u = distancias[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            nova_distancia = dist_u + weights[i]
+
+            if nova_distancia < distancias[v]:
+                distancias[v] = nova_distancia
+                predecessores[v] = u
+
+                node = node_map[v]
+                if node is None:
+                    # Só acontece no modo lazy (vértice ainda não alcançado)
+                    counts['insert'] += 1
+                    node_map[v] = H.insert(key=nova_distancia, payload=v)
+                else:
+                    counts['decrease_key'] += 1
+                    H.decrease_key(node, nova_distancia)
+
     return distancias, predecessores, counts
\ No newline at end of file
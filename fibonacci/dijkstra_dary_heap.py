@@ -0,0 +1,51 @@
+from dary_heap import IndexedDaryHeap
+import math
+
+def dijkstra_dary_heap(G, source, d=4):
+    # Heap d-ário indexado: decrease-key de verdade, sem entradas duplicadas.
+    # Os vértices só entram no heap quando são alcançados pela primeira
+    # vez, então o heap nunca passa de V elementos.
+
+    counts = {
+        'extract_min': 0,
+        'insert': 0,
+        'decrease_key': 0
+    }
+
+    distancias = {}
+    predecessores = {}
+    H = IndexedDaryHeap(d)
+
+    for u in G:
+        distancias[u] = math.inf
+        predecessores[u] = None
+
+    distancias[source] = 0
+    H.push(source, 0)
+    counts['insert'] += 1
+
+    while H:
+
+        # 1. Contar EXTRACT-MIN (cada vértice sai no máximo uma vez)
+        counts['extract_min'] += 1
+        u, dist_u = H.pop()
+
+        if u not in G:
+            continue
+
+        for v, peso in G[u]:
+            nova_distancia = dist_u + peso
+
+            if distancias[v] > nova_distancia:
+                # 2. Contar INSERT (primeira vez) ou DECREASE-KEY
+                if distancias[v] == math.inf:
+                    counts['insert'] += 1
+                    H.push(v, nova_distancia)
+                else:
+                    counts['decrease_key'] += 1
+                    H.decrease_key(v, nova_distancia)
+
+                distancias[v] = nova_distancia
+                predecessores[v] = u
+
+    return distancias, predecessores, counts
\ No newline at end of file
@@ -0,0 +1,105 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from csr_graph import CSRGraph
+from dijkstra_baseline_heapq import dijkstra_baseline_heapq
+from dijkstra_com_fibonacci import dijkstra_com_fibonacci
+
+_BACKENDS = {
+    'heapq': dijkstra_baseline_heapq,
+    'fibonacci': dijkstra_com_fibonacci,
+}
+
+# Estado de cada processo do pool (preenchido por _iniciar_worker)
+_grafo = None
+_dijkstra = None
+_shm = None
+
+def _anexar_grafo(shm, num_vertices, num_arestas):
+    # Monta um CSRGraph sobre a memória compartilhada, sem copiar: o bloco
+    # tem [offsets (V+1) | targets (E)] como int64 e depois weights (E)
+    # como double, e memoryview indexa igual a array
+    fim_q = 8 * (num_vertices + 1 + num_arestas)
+    inteiros = shm.buf[:fim_q].cast('q')
+    offsets = inteiros[:num_vertices + 1]
+    targets = inteiros[num_vertices + 1:]
+    weights = shm.buf[fim_q:fim_q + 8 * num_arestas].cast('d')
+    return CSRGraph(offsets, targets, weights)
+
+def _iniciar_worker(nome_shm, num_vertices, num_arestas, backend):
+    global _grafo, _dijkstra, _shm
+    _shm = SharedMemory(name=nome_shm)
+    _grafo = _anexar_grafo(_shm, num_vertices, num_arestas)
+    _dijkstra = _BACKENDS[backend]
+
+def _resolver(source):
+    distancias, predecessores, counts = _dijkstra(_grafo, source)
+    return source, distancias, predecessores, counts
+
+def _rotular(labels, resultado):
+    # Traduz um resultado em índices de volta para as chaves originais,
+    # no mesmo formato do Dijkstra sobre dicionário: distâncias inf e
+    # predecessor None quando inalcançável
+    source, distancias, predecessores, counts = resultado
+    distancias = dict(zip(labels, distancias))
+    predecessores = {
+        v: (labels[p] if p >= 0 else None) for v, p in zip(labels, predecessores)
+    }
+    return labels[source], distancias, predecessores, counts
+
+def shortest_paths_many(G, sources, backend='heapq', workers=None, chunksize=1):
+    # Dijkstra de várias origens em paralelo. O grafo (dicionário ou
+    # CSRGraph) vai uma única vez para um bloco de memória compartilhada
+    # em formato CSR; cada processo do pool o anexa sem copiar, e só os
+    # índices das origens e os resultados trafegam entre processos.
+    #
+    # É um gerador: devolve (source, distancias, predecessores, counts)
+    # na ordem em que os resultados ficam prontos, com distancias em
+    # array('d') e predecessores em array('q'), como no Dijkstra sobre
+    # CSRGraph. Se o grafo tiver labels (dicionário cujas chaves não são
+    # 0..V-1 nessa ordem), as origens são dadas pelas chaves originais e
+    # o resultado volta com elas: distancias e predecessores viram
+    # dicionários, como no Dijkstra sobre dicionário. A memória
+    # compartilhada é liberada ao final (ou se o consumidor parar antes).
+
+    if backend not in _BACKENDS:
+        raise ValueError("backend deve ser 'heapq' ou 'fibonacci'")
+    if not isinstance(G, CSRGraph):
+        G = CSRGraph.from_adjacency(G)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    labels = G.labels
+    if labels is not None:
+        # Os processos só enxergam índices: traduz as origens antes
+        indice = {k: i for i, k in enumerate(labels)}
+        sources = [indice[s] for s in sources]
+
+    if workers <= 1:
+        # Sem pool: roda no próprio processo
+        dijkstra = _BACKENDS[backend]
+        for source in sources:
+            distancias, predecessores, counts = dijkstra(G, source)
+            resultado = source, distancias, predecessores, counts
+            yield resultado if labels is None else _rotular(labels, resultado)
+        return
+
+    n, m = G.num_vertices, G.num_edges
+    tamanho = 8 * (n + 1 + 2 * m)
+    shm = SharedMemory(create=True, size=max(tamanho, 1))
+    try:
+        # Copia o CSR para o bloco (liberando as views antes do close)
+        fim_offsets = 8 * (n + 1)
+        fim_targets = fim_offsets + 8 * m
+        shm.buf[:fim_offsets] = G.offsets.tobytes()
+        shm.buf[fim_offsets:fim_targets] = G.targets.tobytes()
+        shm.buf[fim_targets:tamanho] = G.weights.tobytes()
+
+        with Pool(workers, initializer=_iniciar_worker,
+                  initargs=(shm.name, n, m, backend)) as pool:
+            for resultado in pool.imap_unordered(_resolver, sources, chunksize):
+                yield resultado if labels is None else _rotular(labels, resultado)
+    finally:
+        shm.close()
+        shm.unlink()
\ No newline at end of file
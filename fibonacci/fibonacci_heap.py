@@ -19,13 +19,20 @@ procedures (CONSOLIDATE, CUT, CASCADING-CUT, FIB-HEAP-LINK) from the book,
 with Pythonic adjustments.
 
 Note: This is an educational implementation prioritizing clarity and
-conformance to the book over maximal micro-optimizations.
+conformance to the book. The hot paths avoid per-call allocations, though:
+extract_min splices the child list into the root list in O(1), CONSOLIDATE
+reuses one degree table sized by the phi bound, and CASCADING-CUT is a loop.
 """
 
 from __future__ import annotations
-from typing import Optional, Any, List
+from typing import Optional, Any, Iterable, Iterator, List, Tuple
+import heapq
+import itertools
 import math
 
+# D(n) <= log_phi(n) = log2(n) / log2(phi) (Cormen, Corollary 19.5)
+_DEGREE_FACTOR = 1 / math.log2((1 + math.sqrt(5)) / 2)
+
 
 class Node:
     __slots__ = (
@@ -60,6 +67,8 @@ class FibonacciHeap:
         # pointer to min node in the root list
         self.min: Optional[Node] = None
         self.n: int = 0
+        # degree table reused by every CONSOLIDATE (always left all None)
+        self._scratch: List[Optional[Node]] = []
 
     # -------------------- low-level circular-list helpers --------------------
     @staticmethod
@@ -105,60 +114,177 @@ class FibonacciHeap:
         self.n += 1
         return x
 
+    def insert_many(self, pairs: Iterable[Tuple[Any, Any]]) -> List[Node]:
+        """Insert (key, payload) pairs in bulk. Returns the new nodes, in order.
+
+        The new nodes are chained into one circular list and spliced into
+        the root list once, tracking the minimum along the way, so each
+        element costs one Node plus a few pointer writes. Time: O(k).
+        """
+        nodes = [Node(key, payload) for key, payload in pairs]
+        if not nodes:
+            return nodes
+        best = nodes[0]
+        prev = nodes[-1]
+        for x in nodes:
+            x.left = prev
+            prev.right = x
+            prev = x
+            if x.key < best.key:
+                best = x
+        m = self.min
+        if m is None:
+            self.min = best
+        else:
+            # splice the two circular lists
+            first, last = nodes[0], nodes[-1]
+            a = m.left
+            a.right = first
+            first.left = a
+            last.right = m
+            m.left = last
+            if best.key < m.key:
+                self.min = best
+        self.n += len(nodes)
+        return nodes
+
+    @classmethod
+    def from_items(cls, pairs: Iterable[Tuple[Any, Any]]) -> "FibonacciHeap":
+        """Build a heap from (key, payload) pairs in O(k) (see insert_many)."""
+        H = cls()
+        H.insert_many(pairs)
+        return H
+
     def minimum(self) -> Optional[Node]:
         """Return the node with minimum key (or None if heap empty). O(1)."""
         return self.min
 
+    def iter_sorted_lazy(self) -> Iterator[Node]:
+        """Yield the nodes in increasing key order without modifying the heap.
+
+        A small heapq frontier starts with the roots; each time a node is
+        yielded its children join the frontier (heap order guarantees they
+        are not smaller). Getting the first k nodes costs
+        O(r + k (D(n) + log(r + k D(n)))) for r roots, with no consolidation.
+        The heap must not be modified while the iterator is in use.
+        """
+        if self.min is None:
+            return
+        # the counter breaks key ties so Nodes are never compared
+        tie = itertools.count()
+        frontier = []
+        curr = self.min
+        while True:
+            frontier.append((curr.key, next(tie), curr))
+            curr = curr.right
+            if curr is self.min:
+                break
+        heapq.heapify(frontier)
+        while frontier:
+            _, _, x = heapq.heappop(frontier)
+            yield x
+            child = x.child
+            if child is not None:
+                curr = child
+                while True:
+                    heapq.heappush(frontier, (curr.key, next(tie), curr))
+                    curr = curr.right
+                    if curr is child:
+                        break
+
+    def peek_k(self, k: int) -> List[Node]:
+        """Return the (up to) k nodes with the smallest keys, in order,
+        without modifying the heap (see iter_sorted_lazy).
+        """
+        return list(itertools.islice(self.iter_sorted_lazy(), k))
+
     def union(self, other: "FibonacciHeap") -> "FibonacciHeap":
         """Union two Fibonacci heaps in O(1) (amortized). The two input heaps
         are destroyed conceptually: their root lists are concatenated and a
         new heap is returned.
         """
         H = FibonacciHeap()
-        H.min = self.min
-        # concatenate root lists
-        if H.min is None:
-            H.min = other.min
-        elif other.min is not None:
-            # splice the two circular lists
-            a = H.min.left
-            b = other.min.left
-            a.right = other.min
-            other.min.left = a
-            b.right = H.min
-            H.min.left = b
-            # choose min pointer
-            if other.min.key < H.min.key:
-                H.min = other.min
-        H.n = self.n + other.n
-        # invalidate the two heaps (optional) -- for safety we clear them
-        self.min = None
-        self.n = 0
+        H.meld(self)
+        H.meld(other)
+        return H
+
+    def meld(self, other: "FibonacciHeap") -> None:
+        """Move all nodes of other into this heap, in place, in O(1).
+
+        The root lists are spliced and other is left empty; its nodes stay
+        valid handles in self.
+        """
+        if other is self or other.min is None:
+            return
+        if self.min is None:
+            self.min = other.min
+        else:
+            self._splice(self.min, other.min)
+            if other.min.key < self.min.key:
+                self.min = other.min
+        self.n += other.n
         other.min = None
         other.n = 0
+
+    @classmethod
+    def union_all(cls, heaps: Iterable["FibonacciHeap"]) -> "FibonacciHeap":
+        """Union any number of heaps into a new one with a single pass over
+        them: every root list is spliced in O(1) and the minimum is picked
+        along the way, so k heaps cost O(k). The input heaps are emptied.
+        """
+        H = cls()
+        m = None
+        n = 0
+        for h in heaps:
+            hm = h.min
+            if hm is None or h is H:
+                continue
+            if m is None:
+                m = hm
+            else:
+                cls._splice(m, hm)
+                if hm.key < m.key:
+                    m = hm
+            n += h.n
+            h.min = None
+            h.n = 0
+        H.min = m
+        H.n = n
         return H
 
+    @staticmethod
+    def _splice(a: Node, b: Node) -> None:
+        """Concatenate the circular lists containing a and b (b's list goes
+        to the left of a).
+        """
+        al = a.left
+        bl = b.left
+        al.right = b
+        b.left = al
+        bl.right = a
+        a.left = bl
+
     # -------------------- extract-min and helpers --------------------
     def extract_min(self) -> Optional[Node]:
         z = self.min
         if z is not None:
-            # For each child of z, add to root list
-            children = []
             child = z.child
             if child is not None:
-                # gather children (they are in a circular list)
+                # children become roots: clear their parent links, then
+                # splice the whole child list to the left of z in O(1)
                 curr = child
                 while True:
-                    children.append(curr)
+                    curr.parent = None
                     curr = curr.right
                     if curr is child:
                         break
-                # for each child: remove parent link and add to root list
-                for c in children:
-                    c.parent = None
-                    # remove c from its sibling list and insert into root list
-                    FibonacciHeap._remove_from_list(c)
-                    self.min = self._insert_into_root_list(self.min, c)
+                zl = z.left
+                cl = child.left
+                zl.right = child
+                child.left = zl
+                cl.right = z
+                z.left = cl
+                z.child = None
             # remove z from root list
             if z.right is z:
                 # z was the only node in root list
@@ -175,29 +301,23 @@ class FibonacciHeap:
         return z
 
     def _consolidate(self) -> None:
-        # upper bound on degree: floor(log_phi(n)) where phi ~=1.618.
-        # using log2 is safe; we add some slack.
         if self.n <= 0:
             return
-        max_deg = int(math.log(self.n, 2)) + 2
-        A: List[Optional[Node]] = [None] * (max_deg + 1)
+        # degree bound D(n) <= log_phi(n); bit_length() >= log2(n)
+        A = self._scratch
+        max_deg = int(self.n.bit_length() * _DEGREE_FACTOR) + 1
+        if len(A) <= max_deg:
+            A.extend([None] * (max_deg + 1 - len(A)))
 
-        # collect roots into a list (to iterate safely while mutating root list)
-        roots: List[Node] = []
-        curr = self.min
-        if curr is not None:
-            while True:
-                roots.append(curr)
-                curr = curr.right
-                if curr is self.min:
-                    break
-
-        for w in roots:
+        # walk the root list once. Linking only removes roots that were
+        # already visited (or the current one), so the saved right pointer
+        # of the current root stays valid and 'stop' is reached last.
+        w = self.min
+        stop = w.left
+        while True:
+            nxt = w.right
             x = w
             d = x.degree
-            # ensure A big enough
-            while d >= len(A):
-                A.extend([None] * len(A))
             while A[d] is not None:
                 y = A[d]
                 if x.key > y.key:
@@ -207,11 +327,16 @@ class FibonacciHeap:
                 A[d] = None
                 d += 1
             A[d] = x
+            if w is stop:
+                break
+            w = nxt
 
-        # rebuild root list and find new min
+        # rebuild root list and find new min, leaving A all None for reuse
         self.min = None
-        for entry in A:
+        for d in range(len(A)):
+            entry = A[d]
             if entry is not None:
+                A[d] = None
                 # isolate entry into single-node circular list
                 entry.left = entry.right = entry
                 if self.min is None:
@@ -272,13 +397,15 @@ class FibonacciHeap:
         x.mark = False
 
     def _cascading_cut(self, y: Node) -> None:
+        # walked iteratively up the tree instead of recursing
         z = y.parent
-        if z is not None:
+        while z is not None:
             if not y.mark:
                 y.mark = True
-            else:
-                self._cut(y, z)
-                self._cascading_cut(z)
+                return
+            self._cut(y, z)
+            y = z
+            z = y.parent
 
     # -------------------- delete --------------------
     def delete(self, x: Node) -> None:
@@ -286,6 +413,29 @@ class FibonacciHeap:
         self.decrease_key(x, float("-inf"))
         self.extract_min()
 
+    # -------------------- increase-key --------------------
+    def increase_key(self, x: Node, k: Any) -> None:
+        """Raise the key of x to k, keeping x as the handle.
+
+        Raising a key can break heap order below x, so x is deleted and the
+        same node is re-inserted as a fresh root with the new key.
+        Time: O(lg n) amortized (the cost of delete).
+        """
+        if k < x.key:
+            raise ValueError("new key is smaller than current key")
+        self.delete(x)
+        # reset x as a single-node tree and put it back in the root list
+        x.key = k
+        x.degree = 0
+        x.mark = False
+        x.parent = None
+        x.child = None
+        x.left = x.right = x
+        self.min = self._insert_into_root_list(self.min, x)
+        if x.key < self.min.key:
+            self.min = x
+        self.n += 1
+
 
 # -------------------- optional small demo when run as script --------------------
 if __name__ == "__main__":
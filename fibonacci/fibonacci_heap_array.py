@@ -0,0 +1,332 @@
+"""
+Struct-of-arrays Fibonacci Heap (same algorithm as fibonacci_heap.py).
+
+Instead of one Node object per element, every field (key, degree, mark,
+parent, child, left, right, payload) lives in its own preallocated array
+indexed by an integer handle. insert(...) returns that handle, which can be
+kept in plain int arrays and passed to decrease_key/delete.
+
+- key/payload are lists holding the user objects (keys only need to be
+  comparable);
+- parent/child/left/right are array('i') (4 bytes per slot) and degree
+  and mark are bytearrays (a degree is at most 1.44 * log2(n), well under
+  256), so the links cost 18 bytes per slot instead of a Node object.
+  Reading an array item creates a new int for values above 256, so the
+  link walks are not faster than with Node attributes; the saving is
+  memory.
+
+Slots are recycled: the handle returned by extract_min (and its key and
+payload) stays readable until the next insert, which may reuse it.
+
+The handle API differs from FibonacciHeap, so this class is not a heap_cls
+for dijkstra_com_fibonacci: insert and extract_min return int handles
+(read heap.keys[h] / heap.payloads[h]) rather than nodes with .key and
+.payload, and the min is read with minimum() (None when empty); there is
+no .min attribute.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Optional
+
+NIL = -1
+
+
+class ArrayFibonacciHeap:
+    def __init__(self, capacity: int = 16):
+        capacity = max(capacity, 1)
+        self.keys: list = [None] * capacity
+        self.payloads: list = [None] * capacity
+        self._degree = bytearray(capacity)
+        self._mark = bytearray(capacity)
+        self._parent = array("i", [NIL]) * capacity
+        self._child = array("i", [NIL]) * capacity
+        self._left = array("i", [NIL]) * capacity
+        self._right = array("i", [NIL]) * capacity
+        # handle of the min root (NIL when empty); see minimum()
+        self._min: int = NIL
+        self.n: int = 0
+        self._top = 0  # slots ever handed out
+        self._free: list = []  # recycled slots
+        self._scratch: list = []  # degree table reused by _consolidate
+
+    @property
+    def slots(self) -> int:
+        """Number of slots handed out so far (handles are < slots)."""
+        return self._top
+
+    def _grow(self) -> None:
+        extra = max(len(self.keys), 16)
+        self.keys.extend([None] * extra)
+        self.payloads.extend([None] * extra)
+        self._degree.extend(bytes(extra))
+        self._mark.extend(bytes(extra))
+        nil = array("i", [NIL]) * extra
+        self._parent.extend(nil)
+        self._child.extend(nil)
+        self._left.extend(nil)
+        self._right.extend(nil)
+
+    def _add_root(self, x: int) -> None:
+        """Insert x to the left of the min root and update the min."""
+        left, right = self._left, self._right
+        m = self._min
+        if m == NIL:
+            left[x] = right[x] = x
+            self._min = x
+            return
+        lm = left[m]
+        left[x] = lm
+        right[x] = m
+        right[lm] = x
+        left[m] = x
+        if self.keys[x] < self.keys[m]:
+            self._min = x
+
+    # -------------------- public interface --------------------
+    def insert(self, key: Any, payload: Any = None) -> int:
+        """Insert a key (and optional payload). Returns its integer handle.
+
+        Time: O(1) amortized.
+        """
+        if self._free:
+            x = self._free.pop()
+        else:
+            if self._top == len(self.keys):
+                self._grow()
+            x = self._top
+            self._top += 1
+        self.keys[x] = key
+        self.payloads[x] = payload
+        self._degree[x] = 0
+        self._mark[x] = 0
+        self._parent[x] = NIL
+        self._child[x] = NIL
+        # add x to root list (inlined _add_root)
+        left, right = self._left, self._right
+        m = self._min
+        if m == NIL:
+            left[x] = right[x] = x
+            self._min = x
+        else:
+            lm = left[m]
+            left[x] = lm
+            right[x] = m
+            right[lm] = x
+            left[m] = x
+            if key < self.keys[m]:
+                self._min = x
+        self.n += 1
+        return x
+
+    def minimum(self) -> Optional[int]:
+        """Return the handle with minimum key (or None if empty). O(1)."""
+        return None if self._min == NIL else self._min
+
+    def union(self, other: "ArrayFibonacciHeap") -> "ArrayFibonacciHeap":
+        """Union two heaps; both inputs are emptied and a new heap returned.
+
+        Handles from self keep their value. Handles from other are shifted
+        by self.slots (read before the call). Unlike the pointer-based heap
+        this copies other's arrays, so it costs O(other.slots).
+        """
+        H = ArrayFibonacciHeap.__new__(ArrayFibonacciHeap)
+        offset = self._top
+        top = offset + other._top
+
+        # H takes over self's arrays, trimmed to the slots in use
+        for name in ("keys", "payloads", "_degree", "_mark",
+                     "_parent", "_child", "_left", "_right"):
+            arr = getattr(self, name)
+            del arr[offset:]
+            arr.extend(getattr(other, name)[:other._top])
+            setattr(H, name, arr)
+        # shift other's links into the new index space
+        for arr in (H._parent, H._child, H._left, H._right):
+            for i in range(offset, top):
+                if arr[i] != NIL:
+                    arr[i] += offset
+
+        H.n = self.n + other.n
+        H._top = top
+        H._free = self._free + [f + offset for f in other._free]
+        H._scratch = self._scratch
+        H._min = self._min
+        if other._min != NIL:
+            other_min = other._min + offset
+            if H._min == NIL:
+                H._min = other_min
+            else:
+                # splice the two circular root lists
+                left, right = H._left, H._right
+                a = left[H._min]
+                b = left[other_min]
+                right[a] = other_min
+                left[other_min] = a
+                right[b] = H._min
+                left[H._min] = b
+                if H.keys[other_min] < H.keys[H._min]:
+                    H._min = other_min
+
+        # invalidate the two heaps
+        self.__init__()
+        other.__init__()
+        return H
+
+    # -------------------- extract-min and helpers --------------------
+    def extract_min(self) -> Optional[int]:
+        z = self._min
+        if z == NIL:
+            return None
+        left, right, parent, child = self._left, self._right, self._parent, self._child
+
+        c = child[z]
+        if c != NIL:
+            # children become roots: clear parents, then splice the whole
+            # child list to the left of z in O(1)
+            x = c
+            while True:
+                parent[x] = NIL
+                x = right[x]
+                if x == c:
+                    break
+            zl = left[z]
+            cl = left[c]
+            right[zl] = c
+            left[c] = zl
+            right[cl] = z
+            left[z] = cl
+            child[z] = NIL
+
+        # remove z from root list
+        if right[z] == z:
+            self._min = NIL
+        else:
+            right[left[z]] = right[z]
+            left[right[z]] = left[z]
+            self._min = right[z]
+        self.n -= 1
+        if self._min != NIL:
+            self._consolidate()
+        self._free.append(z)
+        return z
+
+    def _consolidate(self) -> None:
+        keys, degree, mark = self.keys, self._degree, self._mark
+        left, right, parent, child = self._left, self._right, self._parent, self._child
+
+        # degree bound: log_phi(n) <= 1.4405 * log2(n)
+        A = self._scratch
+        bound = int(self.n.bit_length() * 1.4405) + 2
+        if len(A) < bound:
+            A.extend([NIL] * (bound - len(A)))
+
+        # walk the root list once; roots not yet visited are never touched,
+        # so the saved right pointer stays valid while linking
+        w = self._min
+        stop = left[w]
+        while True:
+            nxt = right[w]
+            x = w
+            d = degree[x]
+            while A[d] != NIL:
+                y = A[d]
+                if keys[x] > keys[y]:
+                    x, y = y, x
+                # link y under x (FIB-HEAP-LINK)
+                parent[y] = x
+                c = child[x]
+                if c == NIL:
+                    left[y] = right[y] = y
+                    child[x] = y
+                else:
+                    lc = left[c]
+                    left[y] = lc
+                    right[y] = c
+                    right[lc] = y
+                    left[c] = y
+                degree[x] += 1
+                mark[y] = 0
+                A[d] = NIL
+                d += 1
+            A[d] = x
+            if w == stop:
+                break
+            w = nxt
+
+        # rebuild root list from the degree table, clearing it for reuse
+        m = NIL
+        for d in range(len(A)):
+            x = A[d]
+            if x == NIL:
+                continue
+            A[d] = NIL
+            if m == NIL:
+                left[x] = right[x] = x
+                m = x
+            else:
+                lm = left[m]
+                left[x] = lm
+                right[x] = m
+                right[lm] = x
+                left[m] = x
+                if keys[x] < keys[m]:
+                    m = x
+        self._min = m
+
+    # -------------------- decrease-key, cut, cascading-cut --------------------
+    def decrease_key(self, x: int, k: Any) -> None:
+        if k > self.keys[x]:
+            raise ValueError("new key is greater than current key")
+        self.keys[x] = k
+        parent = self._parent
+        y = parent[x]
+        if y != NIL and k < self.keys[y]:
+            self._cut(x, y)
+            # cascading cut, walked iteratively up the tree
+            z = parent[y]
+            while z != NIL:
+                if not self._mark[y]:
+                    self._mark[y] = 1
+                    break
+                self._cut(y, z)
+                y = z
+                z = parent[y]
+        if k < self.keys[self._min]:
+            self._min = x
+
+    def _cut(self, x: int, y: int) -> None:
+        left, right = self._left, self._right
+        # remove x from y's child list
+        if self._child[y] == x:
+            self._child[y] = NIL if right[x] == x else right[x]
+        if right[x] != x:
+            left[right[x]] = left[x]
+            right[left[x]] = right[x]
+        self._degree[y] -= 1
+        # add x to root list
+        self._parent[x] = NIL
+        self._mark[x] = 0
+        self._add_root(x)
+
+    # -------------------- delete --------------------
+    def delete(self, x: int) -> None:
+        # decrease key to -infinity, then extract-min
+        self.decrease_key(x, float("-inf"))
+        self.extract_min()
+
+
+# -------------------- optional small demo when run as script --------------------
+if __name__ == "__main__":
+    H = ArrayFibonacciHeap()
+    a = H.insert(7)
+    b = H.insert(3)
+    c = H.insert(17)
+    print("min:", H.keys[H.minimum()])
+    z = H.extract_min()
+    print("extracted:", H.keys[z])
+    print("min after extract:", H.keys[H.minimum()])
+    H.decrease_key(c, 1)
+    print("min after decrease-key:", H.keys[H.minimum()])
+    H.delete(c)
+    print("min after delete:", H.keys[H.minimum()])
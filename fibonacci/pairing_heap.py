@@ -0,0 +1,171 @@
+"""
+Pairing Heap implementation in Python (Fredman, Sedgewick, Sleator and
+Tarjan, 1986), with the same handle-based interface as FibonacciHeap:
+
+- insert(key, payload) -> node handle
+- minimum()
+- union(other)
+- extract_min() -> node
+- decrease_key(node, new_key)
+- delete(node)
+
+The heap is a single heap-ordered multiway tree stored as leftmost-child /
+right-sibling pointers; `prev` points to the left sibling, or to the parent
+for a leftmost child. Every operation is a handful of pointer updates plus
+LINK (the root with the larger key becomes the leftmost child of the other
+one); extract_min combines the children of the root with the standard
+two-pass pairing.
+
+Amortized bounds: insert, union and find-min O(1); extract_min and delete
+O(lg n); decrease_key o(lg n). The constants are much smaller than the
+Fibonacci heap's, which is why it is the usual choice in practice.
+"""
+
+from __future__ import annotations
+from typing import Optional, Any
+
+
+class PairingNode:
+    __slots__ = ("key", "child", "sibling", "prev", "payload")
+
+    def __init__(self, key: Any, payload: Any = None):
+        self.key = key
+        self.child: Optional[PairingNode] = None
+        self.sibling: Optional[PairingNode] = None
+        # left sibling, or parent when this is the leftmost child
+        self.prev: Optional[PairingNode] = None
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f"PairingNode(key={self.key})"
+
+
+class PairingHeap:
+    def __init__(self):
+        # the root of the tree, which holds the minimum key
+        self.min: Optional[PairingNode] = None
+        self.n: int = 0
+
+    # -------------------- low-level helpers --------------------
+    @staticmethod
+    def _link(a: PairingNode, b: PairingNode) -> PairingNode:
+        """Link two roots; the one with the larger key becomes the leftmost
+        child of the other. Returns the new root.
+        """
+        if b.key < a.key:
+            a, b = b, a
+        c = a.child
+        b.sibling = c
+        if c is not None:
+            c.prev = b
+        b.prev = a
+        a.child = b
+        return a
+
+    @staticmethod
+    def _cut(x: PairingNode) -> None:
+        """Detach the subtree rooted at x (not the root) from its tree."""
+        p = x.prev
+        if p.child is x:
+            p.child = x.sibling
+        else:
+            p.sibling = x.sibling
+        if x.sibling is not None:
+            x.sibling.prev = p
+        x.prev = x.sibling = None
+
+    def _merge_pairs(self, first: Optional[PairingNode]) -> Optional[PairingNode]:
+        """Two-pass pairing of the sibling list starting at 'first':
+        link pairs left to right, then link the results right to left.
+        """
+        if first is None:
+            return None
+        pairs = []
+        a = first
+        while a is not None:
+            b = a.sibling
+            if b is None:
+                a.prev = None
+                pairs.append(a)
+                break
+            nxt = b.sibling
+            a.prev = a.sibling = None
+            b.prev = b.sibling = None
+            pairs.append(self._link(a, b))
+            a = nxt
+        root = pairs.pop()
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    # -------------------- public interface --------------------
+    def insert(self, key: Any, payload: Any = None) -> PairingNode:
+        """Insert a key (and optional payload) into the heap. Returns the node.
+
+        Time: O(1)
+        """
+        x = PairingNode(key, payload)
+        self.min = x if self.min is None else self._link(self.min, x)
+        self.n += 1
+        return x
+
+    def minimum(self) -> Optional[PairingNode]:
+        """Return the node with minimum key (or None if heap empty). O(1)."""
+        return self.min
+
+    def union(self, other: "PairingHeap") -> "PairingHeap":
+        """Union two pairing heaps in O(1) by linking their roots. The two
+        input heaps are emptied and a new heap is returned.
+        """
+        H = PairingHeap()
+        if self.min is None:
+            H.min = other.min
+        elif other.min is None:
+            H.min = self.min
+        else:
+            H.min = self._link(self.min, other.min)
+        H.n = self.n + other.n
+        self.min = None
+        self.n = 0
+        other.min = None
+        other.n = 0
+        return H
+
+    def extract_min(self) -> Optional[PairingNode]:
+        z = self.min
+        if z is not None:
+            self.min = self._merge_pairs(z.child)
+            z.child = None
+            self.n -= 1
+        return z
+
+    def decrease_key(self, x: PairingNode, k: Any) -> None:
+        if k > x.key:
+            raise ValueError("new key is greater than current key")
+        x.key = k
+        if x is self.min:
+            return
+        # cut x's subtree and link it back at the root
+        self._cut(x)
+        self.min = self._link(self.min, x)
+
+    def delete(self, x: PairingNode) -> None:
+        # decrease key to -infinity, then extract-min
+        self.decrease_key(x, float("-inf"))
+        self.extract_min()
+
+
+# -------------------- optional small demo when run as script --------------------
+if __name__ == "__main__":
+    H = PairingHeap()
+    a = H.insert(7)
+    b = H.insert(3)
+    c = H.insert(17)
+    print("min:", H.minimum())
+    z = H.extract_min()
+    print("extracted:", z)
+    print("min after extract:", H.minimum())
+    H.decrease_key(c, 1)
+    print("min after decrease-key:", H.minimum())
+    H.delete(c)
+    print("min after delete:", H.minimum())
@@ -0,0 +1,47 @@
+import heapq
+import math
+
+def prim_baseline_heapq(G, source=0):
+    # Prim com heapq: sem decrease-key, cada melhora de chave empilha uma
+    # nova entrada e as obsoletas são descartadas ao sair do heap (mesma
+    # estratégia de dijkstra_baseline_heapq). O(E lg E).
+    #
+    # Devolve (peso_total, predecessores, counts), como prim_com_fibonacci.
+
+    counts = {
+        'extract_min': 0,
+        'insert_relax': 0
+    }
+
+    chave = {}
+    predecessores = {}
+    na_arvore = set()
+    H = []
+
+    for u in G:
+        chave[u] = math.inf
+        predecessores[u] = None
+
+    chave[source] = 0
+    heapq.heappush(H, (0, source))
+
+    peso_total = 0
+    while H:
+
+        counts['extract_min'] += 1
+        (chave_u, u) = heapq.heappop(H)
+
+        if u in na_arvore:
+            continue
+        na_arvore.add(u)
+        peso_total += chave_u
+
+        for v, peso in G[u]:
+            if v not in na_arvore and peso < chave[v]:
+                chave[v] = peso
+                predecessores[v] = u
+
+                counts['insert_relax'] += 1
+                heapq.heappush(H, (peso, v))
+
+    return peso_total, predecessores, counts
\ No newline at end of file
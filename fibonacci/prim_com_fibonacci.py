@@ -0,0 +1,55 @@
+from fibonacci_heap import FibonacciHeap
+import math
+
+def prim_com_fibonacci(G, source=0, heap_cls=FibonacciHeap):
+    # Árvore geradora mínima (Prim) do componente de source em um grafo
+    # não-dirigido. Como em dijkstra_com_fibonacci, todos os vértices
+    # entram no heap com chave infinita e cada aresta que melhora a chave
+    # de um vértice fora da árvore vira um DECREASE-KEY, que no Heap de
+    # Fibonacci custa O(1) amortizado: O(E + V lg V) no total.
+    #
+    # Devolve (peso_total, predecessores, counts); predecessores[v] é o
+    # pai de v na árvore (None para source e para vértices não alcançados).
+
+    counts = {
+        'extract_min': 0,
+        'decrease_key': 0
+    }
+
+    chave = {}
+    predecessores = {}
+    na_arvore = set()
+
+    H = heap_cls()
+
+    for u in G:
+        chave[u] = math.inf
+        predecessores[u] = None
+
+    chave[source] = 0
+
+    if hasattr(H, 'insert_many'):
+        vertices = list(G)
+        node_map = dict(zip(vertices, H.insert_many((chave[u], u) for u in vertices)))
+    else:
+        node_map = {u: H.insert(key=chave[u], payload=u) for u in G}
+
+    peso_total = 0
+    while H.min is not None:
+
+        counts['extract_min'] += 1
+        u = H.extract_min().payload
+        if chave[u] == math.inf:
+            break # O resto não é alcançável a partir de source
+        na_arvore.add(u)
+        peso_total += chave[u]
+
+        for v, peso in G[u]:
+            if v not in na_arvore and peso < chave[v]:
+                chave[v] = peso
+                predecessores[v] = u
+
+                counts['decrease_key'] += 1
+                H.decrease_key(node_map[v], peso)
+
+    return peso_total, predecessores, counts
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Item-keyed priority queue on top of FibonacciHeap.
+
+PriorityDict keeps the item -> Node index that callers of FibonacciHeap
+would otherwise maintain themselves (like node_map in
+dijkstra_com_fibonacci), and picks the right heap operation on assignment:
+
+    pq = PriorityDict()
+    pq["a"] = 5          # insert
+    pq["a"] = 2          # decrease-key
+    pq["a"] = 9          # increase-key
+    pq.pop_item()        # -> ("a", 9)
+
+Items must be hashable; each item appears at most once.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from fibonacci_heap import FibonacciHeap, Node
+
+
+class PriorityDict:
+    def __init__(self):
+        self._heap = FibonacciHeap()
+        self._nodes: Dict[Hashable, Node] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __bool__(self) -> bool:
+        return bool(self._nodes)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._nodes
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the items (in no particular order)."""
+        return iter(self._nodes)
+
+    def __getitem__(self, item: Hashable) -> Any:
+        return self._nodes[item].key
+
+    def __setitem__(self, item: Hashable, priority: Any) -> None:
+        """Insert the item, or move it to the new priority (up or down)."""
+        node = self._nodes.get(item)
+        if node is None:
+            self._nodes[item] = self._heap.insert(priority, item)
+        elif priority < node.key:
+            self._heap.decrease_key(node, priority)
+        elif priority > node.key:
+            self._heap.increase_key(node, priority)
+
+    def __delitem__(self, item: Hashable) -> None:
+        self._heap.delete(self._nodes.pop(item))
+
+    def priority(self, item: Hashable, default: Any = None) -> Any:
+        """Return the priority of an item, or default if it is not queued."""
+        node = self._nodes.get(item)
+        return default if node is None else node.key
+
+    def peek_item(self) -> Optional[Tuple[Hashable, Any]]:
+        """Return (item, priority) with the smallest priority, or None. O(1)."""
+        node = self._heap.min
+        return None if node is None else (node.payload, node.key)
+
+    def pop_item(self) -> Tuple[Hashable, Any]:
+        """Remove and return (item, priority) with the smallest priority.
+
+        Raises KeyError if the queue is empty.
+        """
+        if self._heap.min is None:
+            raise KeyError("pop_item(): priority dict is empty")
+        node = self._heap.extract_min()
+        del self._nodes[node.payload]
+        return node.payload, node.key
+
+
+# -------------------- optional small demo when run as script --------------------
+if __name__ == "__main__":
+    pq = PriorityDict()
+    pq["a"] = 7
+    pq["b"] = 3
+    pq["c"] = 17
+    print("min:", pq.peek_item())
+    pq["c"] = 1
+    print("min after decrease:", pq.peek_item())
+    pq["c"] = 20
+    print("min after increase:", pq.peek_item())
+    print("popped:", [pq.pop_item() for _ in range(len(pq))])
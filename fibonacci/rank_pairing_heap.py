@@ -0,0 +1,226 @@
+"""
+Rank-Pairing Heap implementation in Python (Haeupler, Sen and Tarjan, 2011),
+type-1 variant, with the same handle-based interface as FibonacciHeap:
+
+- insert(key, payload) -> node handle
+- minimum()
+- union(other)
+- extract_min() -> node
+- decrease_key(node, new_key)
+- delete(node)
+
+The heap is a list of half trees: binary trees whose root has only a left
+child, where every node's key is <= the keys in its left subtree. The roots
+form a circular list through `right`, and `min` points at the root with the
+smallest key. A half tree of rank r + 1 is built by linking two of rank r
+(the loser becomes the left child of the winner, and the winner's old left
+child becomes the loser's right child).
+
+extract_min breaks the left child's right spine into new half trees and
+does one-pass linking: each half tree is linked at most once with another
+of the same rank. decrease_key cuts the node's subtree into a new half tree
+and restores the type-1 rank rule going up, which stops as soon as a rank
+does not drop.
+
+Amortized bounds match the Fibonacci heap: insert, union, find-min and
+decrease_key O(1); extract_min and delete O(lg n), with far less structure
+to maintain (no marks, no cascading cuts).
+"""
+
+from __future__ import annotations
+from typing import Optional, Any, List
+
+
+class RankPairingNode:
+    __slots__ = ("key", "rank", "parent", "left", "right", "payload")
+
+    def __init__(self, key: Any, payload: Any = None):
+        self.key = key
+        self.rank = 0
+        self.parent: Optional[RankPairingNode] = None
+        self.left: Optional[RankPairingNode] = None
+        # right child, or next root in the root list for a root
+        self.right: Optional[RankPairingNode] = None
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f"RankPairingNode(key={self.key}, rank={self.rank})"
+
+
+class RankPairingHeap:
+    def __init__(self):
+        # pointer to min root in the circular root list
+        self.min: Optional[RankPairingNode] = None
+        self.n: int = 0
+        self._buckets: List[Optional[RankPairingNode]] = []  # reused by extract_min
+
+    # -------------------- low-level helpers --------------------
+    def _add_root(self, x: RankPairingNode) -> None:
+        """Insert root x after min in the root list and update min."""
+        m = self.min
+        if m is None:
+            x.right = x
+            self.min = x
+            return
+        x.right = m.right
+        m.right = x
+        if x.key < m.key:
+            self.min = x
+
+    @staticmethod
+    def _link(x: RankPairingNode, y: RankPairingNode) -> RankPairingNode:
+        """Link two half trees of equal rank. Returns the winner, whose rank
+        grows by one (its root-list pointer is left for the caller).
+        """
+        if y.key < x.key:
+            x, y = y, x
+        c = x.left
+        y.right = c
+        if c is not None:
+            c.parent = y
+        x.left = y
+        y.parent = x
+        x.rank += 1
+        return x
+
+    # -------------------- public interface --------------------
+    def insert(self, key: Any, payload: Any = None) -> RankPairingNode:
+        """Insert a key (and optional payload) into the heap. Returns the node.
+
+        Time: O(1)
+        """
+        x = RankPairingNode(key, payload)
+        self._add_root(x)
+        self.n += 1
+        return x
+
+    def minimum(self) -> Optional[RankPairingNode]:
+        """Return the node with minimum key (or None if heap empty). O(1)."""
+        return self.min
+
+    def union(self, other: "RankPairingHeap") -> "RankPairingHeap":
+        """Union two rank-pairing heaps in O(1) by splicing their root
+        lists. The two input heaps are emptied and a new heap is returned.
+        """
+        H = RankPairingHeap()
+        H.min = self.min
+        if H.min is None:
+            H.min = other.min
+        elif other.min is not None:
+            a, b = H.min, other.min
+            a.right, b.right = b.right, a.right
+            if b.key < a.key:
+                H.min = b
+        H.n = self.n + other.n
+        self.min = None
+        self.n = 0
+        other.min = None
+        other.n = 0
+        return H
+
+    def extract_min(self) -> Optional[RankPairingNode]:
+        z = self.min
+        if z is None:
+            return None
+        self.n -= 1
+
+        buckets = self._buckets
+        roots: List[RankPairingNode] = []
+
+        def one_pass(t: RankPairingNode) -> None:
+            # link t with the waiting half tree of its rank, if any; the
+            # result goes straight to the new root list
+            r = t.rank
+            if r >= len(buckets):
+                buckets.extend([None] * (r + 1 - len(buckets)))
+            u = buckets[r]
+            if u is None:
+                buckets[r] = t
+            else:
+                buckets[r] = None
+                roots.append(self._link(t, u))
+
+        # the other roots
+        x = z.right
+        while x is not z:
+            nxt = x.right
+            one_pass(x)
+            x = nxt
+        # the right spine of z's left child becomes new half trees
+        x = z.left
+        while x is not None:
+            nxt = x.right
+            x.parent = None
+            x.right = None
+            x.rank = x.left.rank + 1 if x.left is not None else 0
+            one_pass(x)
+            x = nxt
+
+        # half trees left unpaired, clearing the buckets for reuse
+        for r in range(len(buckets)):
+            if buckets[r] is not None:
+                roots.append(buckets[r])
+                buckets[r] = None
+
+        self.min = None
+        for t in roots:
+            self._add_root(t)
+        z.left = z.right = None
+        return z
+
+    def decrease_key(self, x: RankPairingNode, k: Any) -> None:
+        if k > x.key:
+            raise ValueError("new key is greater than current key")
+        x.key = k
+        y = x.parent
+        if y is None:
+            # x is a root
+            if k < self.min.key:
+                self.min = x
+            return
+
+        # replace x by its right child and make x the root of a half tree
+        r = x.right
+        if y.left is x:
+            y.left = r
+        else:
+            y.right = r
+        if r is not None:
+            r.parent = y
+        x.parent = None
+        x.rank = x.left.rank + 1 if x.left is not None else 0
+        self._add_root(x)
+
+        # restore the type-1 rank rule from y upwards
+        while y is not None:
+            if y.parent is None:
+                y.rank = y.left.rank + 1 if y.left is not None else 0
+                break
+            r1 = y.left.rank if y.left is not None else -1
+            r2 = y.right.rank if y.right is not None else -1
+            k = r1 + 1 if r1 == r2 else max(r1, r2)
+            if k >= y.rank:
+                break
+            y.rank = k
+            y = y.parent
+
+    def delete(self, x: RankPairingNode) -> None:
+        # decrease key to -infinity, then extract-min
+        self.decrease_key(x, float("-inf"))
+        self.extract_min()
+
+
+# -------------------- optional small demo when run as script --------------------
+if __name__ == "__main__":
+    H = RankPairingHeap()
+    a = H.insert(7)
+    b = H.insert(3)
+    c = H.insert(17)
+    print("min:", H.minimum())
+    z = H.extract_min()
+    print("extracted:", z)
+    print("min after extract:", H.minimum())
+    H.decrease_key(c, 1)
+    print("min after decrease-key:", H.minimum())
+    H.delete(c)
+    print("min after delete:", H.minimum())
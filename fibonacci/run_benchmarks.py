@@ -7,46 +7,230 @@ import gc # Importa o Garbage Collector
 
 from dijkstra_com_fibonacci import dijkstra_com_fibonacci
 from dijkstra_baseline_heapq import dijkstra_baseline_heapq
+from dijkstra_dary_heap import dijkstra_dary_heap
+from csr_graph import CSRGraph
+from prim_com_fibonacci import prim_com_fibonacci
+from prim_baseline_heapq import prim_baseline_heapq
+from a_estrela_com_fibonacci import a_estrela_com_fibonacci
+from a_estrela_baseline_heapq import a_estrela_baseline_heapq
 
 REPETICOES = 10
 WARMUP_RUNS = 1 # Descarta a primeira execução
 RANDOM_SEED = 42
-random.seed(RANDOM_SEED)
 # ----------------------------------------------------
 
-def gerar_grafo(num_vertices, num_arestas):
+# --- Geradores em tempo linear ---
+# Todos recebem uma semente própria (reprodutíveis, sem depender do estado
+# global de random), sorteiam pesos em [1, 100] e devolvem (G, arestas),
+# onde 'arestas' é o número de arestas não-dirigidas realmente obtido.
+# formato='dict' gera o dicionário de adjacência; formato='csr' monta
+# direto um CSRGraph, sem passar pelas tuplas do dicionário.
+
+def _montar_grafo(num_vertices, us, vs, rng, formato):
+    pesos = [rng.randint(1, 100) for _ in range(len(us))]
+    if formato == 'csr':
+        return CSRGraph.from_edges(num_vertices, zip(us, vs, pesos)), len(us)
+    if formato != 'dict':
+        raise ValueError("formato deve ser 'dict' ou 'csr'")
+    G = {i: [] for i in range(num_vertices)}
+    for u, v, peso in zip(us, vs, pesos):
+        G[u].append((v, peso))
+        G[v].append((u, peso)) # Não-dirigido
+    return G, len(us)
+
+def gerar_grafo_gnm(num_vertices, num_arestas, seed=RANDOM_SEED, formato='dict'):
     """
-    Gera um grafo aleatório usando o modelo G(V, E=m)
-    G: Dicionário de adjacência {u: [(v, peso), ...]}
-    Gera grafos não-dirigidos.
+    Modelo G(n, m) com o caminho 0-1-2-...-(n-1) garantindo conectividade.
+    As arestas são pares u<v codificados como u*n+v num
+    set, então checar duplicatas é O(1). Se m passa da metade dos pares
+    possíveis, sorteia-se o complemento (os pares que ficam de fora), o que
+    mantém o custo O(n + m). m é limitado a n(n-1)/2.
     """
-    G = {i: [] for i in range(num_vertices)}
-    
-    arestas_adicionadas = 0
-    max_iter = num_arestas * 5 # Segurança para evitar loop infinito
-    
-    # Garante conectividade mínima (caminho simples 0->1->2...)
-    for i in range(num_vertices - 1):
-        if arestas_adicionadas < num_arestas:
-            peso = random.randint(1, 100)
-            G[i].append((i+1, peso))
-            G[i+1].append((i, peso)) # Não-dirigido
-            arestas_adicionadas += 1
-
-    # Adiciona arestas aleatórias restantes
-    while arestas_adicionadas < num_arestas and max_iter > 0:
-        u = random.randint(0, num_vertices - 1)
-        v = random.randint(0, num_vertices - 1)
-        
-        if u != v and not any(neighbor == v for neighbor, _ in G[u]):
-            peso = random.randint(1, 100)
-            G[u].append((v, peso))
-            G[v].append((u, peso)) # Não-dirigido
-            arestas_adicionadas += 1
-        
-        max_iter -= 1
-            
-    return G
+    rng = random.Random(seed)
+    n = num_vertices
+    total = n * (n - 1) // 2
+    m = min(num_arestas, total)
+
+    caminho = min(n - 1, m)
+    escolhidas = {u * n + u + 1 for u in range(caminho)}
+
+    if m <= total // 2:
+        while len(escolhidas) < m:
+            u = rng.randrange(n)
+            v = rng.randrange(n)
+            if u != v:
+                if u > v:
+                    u, v = v, u
+                escolhidas.add(u * n + v)
+        codigos = escolhidas
+    else:
+        # Sorteia os pares excluídos (fora do caminho) e percorre todos
+        excluidas = set()
+        while len(excluidas) < total - m:
+            u = rng.randrange(n)
+            v = rng.randrange(n)
+            if u != v:
+                if u > v:
+                    u, v = v, u
+                if v != u + 1 or u >= caminho:
+                    excluidas.add(u * n + v)
+        codigos = [u * n + v for u in range(n) for v in range(u + 1, n)
+                   if u * n + v not in excluidas]
+
+    codigos = sorted(codigos) # Ordem independente do hash do set
+    us = [c // n for c in codigos]
+    vs = [c % n for c in codigos]
+    return _montar_grafo(n, us, vs, rng, formato)
+
+def gerar_grafo_gnp(num_vertices, p, seed=RANDOM_SEED, formato='dict'):
+    """
+    Modelo G(n, p): cada par u<v vira aresta com probabilidade p. Em vez de
+    testar os n(n-1)/2 pares, pula direto para o próximo par sorteado com um
+    salto geométrico (Batagelj e Brandes, 2005), em O(n + m).
+    """
+    rng = random.Random(seed)
+    n = num_vertices
+    us, vs = [], []
+    if p <= 0:
+        return _montar_grafo(n, us, vs, rng, formato)
+    if p >= 1:
+        for v in range(1, n):
+            for u in range(v):
+                us.append(u)
+                vs.append(v)
+        return _montar_grafo(n, us, vs, rng, formato)
+
+    log_q = math.log(1 - p)
+    v, w = 1, -1
+    while v < n:
+        w += 1 + int(math.log(1 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            us.append(w)
+            vs.append(v)
+    return _montar_grafo(n, us, vs, rng, formato)
+
+def gerar_grafo_grade(linhas, colunas, seed=RANDOM_SEED, formato='dict'):
+    """
+    Grade linhas x colunas com vizinhança 4 (vértice r*colunas + c), como
+    um mapa de estradas; tem V = linhas*colunas e ~2V arestas.
+    """
+    rng = random.Random(seed)
+    us, vs = [], []
+    for r in range(linhas):
+        for c in range(colunas):
+            u = r * colunas + c
+            if c + 1 < colunas:
+                us.append(u)
+                vs.append(u + 1)
+            if r + 1 < linhas:
+                us.append(u)
+                vs.append(u + colunas)
+    return _montar_grafo(linhas * colunas, us, vs, rng, formato)
+
+def heuristica_manhattan(colunas, alvo, peso_min=1):
+    """
+    Heurística do A* para gerar_grafo_grade: distância de Manhattan até o
+    alvo vezes o menor peso de aresta. Nunca superestima e é consistente.
+    """
+    linha_alvo, coluna_alvo = divmod(alvo, colunas)
+    def h(v):
+        linha, coluna = divmod(v, colunas)
+        return peso_min * (abs(linha - linha_alvo) + abs(coluna - coluna_alvo))
+    return h
+
+def gerar_grafo_ba(num_vertices, k, seed=RANDOM_SEED, formato='dict'):
+    """
+    Barabási-Albert (lei de potência): cada vértice novo liga-se a k
+    vértices distintos já existentes, escolhidos com probabilidade
+    proporcional ao grau. A lista 'extremos' repete cada vértice uma vez
+    por aresta, então sortear dela é a escolha preferencial em O(1).
+    Começa com uma estrela em torno do vértice 0; ~k*n arestas.
+    """
+    rng = random.Random(seed)
+    n = num_vertices
+    k = max(1, min(k, n - 1))
+    us, vs = [], []
+    extremos = []
+    for v in range(1, min(k + 1, n)):
+        us.append(0)
+        vs.append(v)
+        extremos += (0, v)
+    for v in range(k + 1, n):
+        alvos = set()
+        while len(alvos) < k:
+            alvos.add(extremos[rng.randrange(len(extremos))])
+        for u in sorted(alvos):
+            us.append(u)
+            vs.append(v)
+            extremos += (u, v)
+    return _montar_grafo(n, us, vs, rng, formato)
+
+def medir_cenario(tipo, v, e):
+    """
+    Gera um grafo G(V, E) e mede as três variantes do Dijkstra nele.
+    Retorna a linha do CSV com médias, desvios e contadores.
+    """
+    print(f"Gerando e testando V={v}, E={e}...", end=" ", flush=True)
+    G, obtidas = gerar_grafo_gnm(v, e, seed=RANDOM_SEED + v)
+    if obtidas < e:
+        print(f"(só {obtidas} arestas possíveis)", end=" ", flush=True)
+
+    tempos_fib, tempos_bin, tempos_dary = [], [], []
+    fib_extracts, fib_decreases = [], []
+    bin_extracts, bin_inserts = [], []
+    dary_extracts, dary_decreases = [], []
+
+    for i in range(REPETICOES + WARMUP_RUNS):
+        gc.collect()
+
+        # Teste Fibonacci
+        inicio = time.perf_counter()
+        _, _, fib_counts = dijkstra_com_fibonacci(G, 0)
+        fim = time.perf_counter()
+
+        if i >= WARMUP_RUNS:
+            tempos_fib.append(fim - inicio)
+            fib_extracts.append(fib_counts['extract_min'])
+            fib_decreases.append(fib_counts['decrease_key'])
+
+        gc.collect()
+        # Teste Binary Heap (Baseline)
+        inicio = time.perf_counter()
+        _, _, bin_counts = dijkstra_baseline_heapq(G, 0)
+        fim = time.perf_counter()
+
+        if i >= WARMUP_RUNS:
+            tempos_bin.append(fim - inicio)
+            bin_extracts.append(bin_counts['extract_min'])
+            bin_inserts.append(bin_counts['insert_relax'])
+
+        gc.collect()
+        # Teste Heap d-ário indexado (decrease-key sem duplicatas)
+        inicio = time.perf_counter()
+        _, _, dary_counts = dijkstra_dary_heap(G, 0)
+        fim = time.perf_counter()
+
+        if i >= WARMUP_RUNS:
+            tempos_dary.append(fim - inicio)
+            dary_extracts.append(dary_counts['extract_min'])
+            dary_decreases.append(dary_counts['decrease_key'])
+
+    print(f"Fib: {statistics.mean(tempos_fib):.4f}s, Bin: {statistics.mean(tempos_bin):.4f}s, "
+          f"D-ário: {statistics.mean(tempos_dary):.4f}s")
+
+    # Calcular estatísticas
+    return [
+        tipo, v, e,
+        statistics.mean(tempos_fib), statistics.stdev(tempos_fib) if REPETICOES > 1 else 0,
+        statistics.mean(tempos_bin), statistics.stdev(tempos_bin) if REPETICOES > 1 else 0,
+        statistics.mean(fib_extracts), statistics.mean(fib_decreases),
+        statistics.mean(bin_extracts), statistics.mean(bin_inserts),
+        statistics.mean(tempos_dary), statistics.stdev(tempos_dary) if REPETICOES > 1 else 0,
+        statistics.mean(dary_extracts), statistics.mean(dary_decreases)
+    ]
 
 def executar_teste():
     resultados = []
@@ -61,46 +245,7 @@ def executar_teste():
     print("\n--- Rodando Cenário: ESPARSO (E = 2V) ---")
     for v in tamanhos_esparsos:
         e = 2 * v
-        print(f"Gerando e testando V={v}, E={e}...", end=" ", flush=True)
-        G = gerar_grafo(v, e)
-        
-        tempos_fib, tempos_bin = [], []
-        fib_extracts, fib_decreases = [], []
-        bin_extracts, bin_inserts = [], []
-
-        for i in range(REPETICOES + WARMUP_RUNS):
-            gc.collect()
-            
-            # Teste Fibonacci
-            inicio = time.perf_counter()
-            _, _, fib_counts = dijkstra_com_fibonacci(G, 0)
-            fim = time.perf_counter()
-            
-            if i >= WARMUP_RUNS:
-                tempos_fib.append(fim - inicio)
-                fib_extracts.append(fib_counts['extract_min'])
-                fib_decreases.append(fib_counts['decrease_key'])
-
-            gc.collect()
-            # Teste Binary Heap (Baseline)
-            inicio = time.perf_counter()
-            _, _, bin_counts = dijkstra_baseline_heapq(G, 0)
-            fim = time.perf_counter()
-
-            if i >= WARMUP_RUNS:
-                tempos_bin.append(fim - inicio)
-                bin_extracts.append(bin_counts['extract_min'])
-                bin_inserts.append(bin_counts['insert_relax'])
-        
-        # Calcular estatísticas
-        resultados.append([
-            "Esparso", v, e,
-            statistics.mean(tempos_fib), statistics.stdev(tempos_fib) if REPETICOES > 1 else 0,
-            statistics.mean(tempos_bin), statistics.stdev(tempos_bin) if REPETICOES > 1 else 0,
-            statistics.mean(fib_extracts), statistics.mean(fib_decreases),
-            statistics.mean(bin_extracts), statistics.mean(bin_inserts)
-        ])
-        print(f"Fib: {statistics.mean(tempos_fib):.4f}s, Bin: {statistics.mean(tempos_bin):.4f}s")
+        resultados.append(medir_cenario("Esparso", v, e))
 
 
     # --- Cenário 2: DENSO (E ≈ 0.4 * V^2) ---
@@ -109,41 +254,7 @@ def executar_teste():
     print("\n--- Rodando Cenário: DENSO (E ≈ 0.4 * V^2) ---")
     for v in tamanhos_densos:
         e = int(0.4 * v * (v - 1) / 2) # /2 pois é não-dirigido
-        print(f"Gerando e testando V={v}, E={e}...", end=" ", flush=True)
-        G = gerar_grafo(v, e)
-        
-        tempos_fib, tempos_bin = [], []
-        fib_extracts, fib_decreases = [], []
-        bin_extracts, bin_inserts = [], []
-
-        for i in range(REPETICOES + WARMUP_RUNS):
-            gc.collect()
-            inicio = time.perf_counter()
-            _, _, fib_counts = dijkstra_com_fibonacci(G, 0)
-            fim = time.perf_counter()
-            if i >= WARMUP_RUNS:
-                tempos_fib.append(fim - inicio)
-                fib_extracts.append(fib_counts['extract_min'])
-                fib_decreases.append(fib_counts['decrease_key'])
-
-            gc.collect()
-            inicio = time.perf_counter()
-            _, _, bin_counts = dijkstra_baseline_heapq(G, 0)
-            fim = time.perf_counter()
-            if i >= WARMUP_RUNS:
-                tempos_bin.append(fim - inicio)
-                bin_extracts.append(bin_counts['extract_min'])
-                bin_inserts.append(bin_counts['insert_relax'])
-
-        # Calcular estatísticas
-        resultados.append([
-            "Denso", v, e,
-            statistics.mean(tempos_fib), statistics.stdev(tempos_fib) if REPETICOES > 1 else 0,
-            statistics.mean(tempos_bin), statistics.stdev(tempos_bin) if REPETICOES > 1 else 0,
-            statistics.mean(fib_extracts), statistics.mean(fib_decreases),
-            statistics.mean(bin_extracts), statistics.mean(bin_inserts)
-        ])
-        print(f"Fib: {statistics.mean(tempos_fib):.4f}s, Bin: {statistics.mean(tempos_bin):.4f}s")
+        resultados.append(medir_cenario("Denso", v, e))
 
 
     filename = "benchmark_resultados.csv"
@@ -154,11 +265,91 @@ def executar_teste():
             "Tempo_Fib_Mean_s", "Tempo_Fib_Std_s", 
             "Tempo_Bin_Mean_s", "Tempo_Bin_Std_s",
             "Fib_Extracts", "Fib_Decreases",
-            "Bin_Extracts", "Bin_Inserts"
+            "Bin_Extracts", "Bin_Inserts",
+            "Tempo_Dary_Mean_s", "Tempo_Dary_Std_s",
+            "Dary_Extracts", "Dary_Decreases"
         ])
         writer.writerows(resultados)
     
     print(f"\nTeste finalizado! Resultados salvos em '{filename}'.")
 
+def medir_par(fib, binario):
+    """
+    Mede duas funções sem argumentos que devolvem (_, _, counts): a versão
+    com FibonacciHeap (contadores extract_min/decrease_key) e a com heapq
+    (extract_min/insert_relax). Retorna as médias, desvios e contadores.
+    """
+    tempos_fib, tempos_bin = [], []
+    fib_extracts, fib_decreases = [], []
+    bin_extracts, bin_inserts = [], []
+
+    for i in range(REPETICOES + WARMUP_RUNS):
+        gc.collect()
+        inicio = time.perf_counter()
+        _, _, fib_counts = fib()
+        fim = time.perf_counter()
+        if i >= WARMUP_RUNS:
+            tempos_fib.append(fim - inicio)
+            fib_extracts.append(fib_counts['extract_min'])
+            fib_decreases.append(fib_counts['decrease_key'])
+
+        gc.collect()
+        inicio = time.perf_counter()
+        _, _, bin_counts = binario()
+        fim = time.perf_counter()
+        if i >= WARMUP_RUNS:
+            tempos_bin.append(fim - inicio)
+            bin_extracts.append(bin_counts['extract_min'])
+            bin_inserts.append(bin_counts['insert_relax'])
+
+    print(f"Fib: {statistics.mean(tempos_fib):.4f}s, Bin: {statistics.mean(tempos_bin):.4f}s")
+    return [
+        statistics.mean(tempos_fib), statistics.stdev(tempos_fib) if REPETICOES > 1 else 0,
+        statistics.mean(tempos_bin), statistics.stdev(tempos_bin) if REPETICOES > 1 else 0,
+        statistics.mean(fib_extracts), statistics.mean(fib_decreases),
+        statistics.mean(bin_extracts), statistics.mean(bin_inserts)
+    ]
+
+def executar_teste_prim_a_estrela():
+    resultados = []
+
+    print(f"\n=== PRIM e A* (Fibonacci vs Binary Heap) ===")
+
+    # --- Prim: mesmos cenários do Dijkstra; o denso é o caso com muitos
+    # DECREASE-KEY, onde o O(1) amortizado do Fibonacci deve aparecer ---
+    cenarios = [("Esparso", v, 2 * v) for v in [100, 1000, 5000]]
+    cenarios += [("Denso", v, int(0.4 * v * (v - 1) / 2)) for v in [100, 300, 500]]
+    for tipo, v, e in cenarios:
+        G, e = gerar_grafo_gnm(v, e, seed=RANDOM_SEED + v)
+        print(f"Prim {tipo} V={v}, E={e}...", end=" ", flush=True)
+        linha = medir_par(lambda: prim_com_fibonacci(G, 0), lambda: prim_baseline_heapq(G, 0))
+        resultados.append(["Prim", tipo, v, e] + linha)
+
+    # --- A*: grade LxL do canto (0) ao canto oposto, heurística Manhattan ---
+    for lado in [30, 100, 200]:
+        G, e = gerar_grafo_grade(lado, lado, seed=RANDOM_SEED + lado)
+        v = lado * lado
+        alvo = v - 1
+        h = heuristica_manhattan(lado, alvo)
+        print(f"A* Grade V={v}, E={e}...", end=" ", flush=True)
+        linha = medir_par(lambda: a_estrela_com_fibonacci(G, 0, alvo, h),
+                          lambda: a_estrela_baseline_heapq(G, 0, alvo, h))
+        resultados.append(["A*", "Grade", v, e] + linha)
+
+    filename = "benchmark_prim_a_estrela.csv"
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([
+            "Algoritmo", "Tipo", "Vertices", "Arestas",
+            "Tempo_Fib_Mean_s", "Tempo_Fib_Std_s",
+            "Tempo_Bin_Mean_s", "Tempo_Bin_Std_s",
+            "Fib_Extracts", "Fib_Decreases",
+            "Bin_Extracts", "Bin_Inserts"
+        ])
+        writer.writerows(resultados)
+
+    print(f"\nResultados de Prim e A* salvos em '{filename}'.")
+
 if __name__ == "__main__":
-    executar_teste()
\ No newline at end of file
+    executar_teste()
+    executar_teste_prim_a_estrela()
\ No newline at end of file